@@ -320,6 +320,10 @@ class Application:
                 self.game_engine.update(dt)
                 self.game_engine.render()
                 
+                # Esperar al siguiente frame atendiendo eventos en cuanto lleguen
+                # (dentro del try: un evento defectuoso cuenta como error de iteración, no es fatal)
+                await self.game_engine.wait_events(dt)
+                
                 # Reset error counter on successful iteration
                 consecutive_errors = 0
                 
@@ -347,8 +351,9 @@ class Application:
                     _show_error_dialog(e, crash_file)
                     self.game_engine.running = False
                     break
-            
-            await asyncio.sleep(dt)
+                
+                # Mantener el ritmo de frames aunque la iteración haya fallado
+                await asyncio.sleep(dt)
     
     async def _cleanup(self) -> None:
         logger.info("Cleaning up...")
@@ -186,33 +186,38 @@ class AssetManager:
         tolerance = 25  # Increased tolerance for better matching
         
         cleaned = surface.copy()
-        for x in range(width):
-            for y in range(height):
-                r, g, b, a = cleaned.get_at((x, y))
-                
-                # Skip already transparent pixels
-                if a == 0:
-                    continue
-                
-                # Check against all known background colors
-                should_remove = False
-                for bg_color in bg_colors:
-                    if (
-                        abs(r - bg_color[0]) <= tolerance
-                        and abs(g - bg_color[1]) <= tolerance
-                        and abs(b - bg_color[2]) <= tolerance
-                    ):
-                        should_remove = True
-                        break
-                
-                # Also remove very dark pixels near edges (common background)
-                edge_margin = 3
-                is_near_edge = (x < edge_margin or x >= width - edge_margin or 
-                               y < edge_margin or y >= height - edge_margin)
-                is_very_dark = (r < 40 and g < 45 and b < 60)
-                
-                if should_remove or (is_near_edge and is_very_dark):
-                    cleaned.set_at((x, y), (r, g, b, 0))
+        # Bloquear una sola vez para todo el recorrido get_at/set_at
+        cleaned.lock()
+        try:
+            for x in range(width):
+                for y in range(height):
+                    r, g, b, a = cleaned.get_at((x, y))
+                    
+                    # Skip already transparent pixels
+                    if a == 0:
+                        continue
+                    
+                    # Check against all known background colors
+                    should_remove = False
+                    for bg_color in bg_colors:
+                        if (
+                            abs(r - bg_color[0]) <= tolerance
+                            and abs(g - bg_color[1]) <= tolerance
+                            and abs(b - bg_color[2]) <= tolerance
+                        ):
+                            should_remove = True
+                            break
+                    
+                    # Also remove very dark pixels near edges (common background)
+                    edge_margin = 3
+                    is_near_edge = (x < edge_margin or x >= width - edge_margin or 
+                                   y < edge_margin or y >= height - edge_margin)
+                    is_very_dark = (r < 40 and g < 45 and b < 60)
+                    
+                    if should_remove or (is_near_edge and is_very_dark):
+                        cleaned.set_at((x, y), (r, g, b, 0))
+        finally:
+            cleaned.unlock()
         
         return cleaned
     
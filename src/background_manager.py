@@ -147,6 +147,7 @@ class BackgroundManager:
                         self.background_image, 
                         (new_width, self.height)
                     )
+                    self.background_image = self._to_display_format(self.background_image)
                     self.has_image_bg = True
                     logger.info(f"✅ Loaded background image: {path}")
                     return
@@ -181,32 +182,56 @@ class BackgroundManager:
         
         logger.info(f"⭐ Generated {len(self.stars)} crisp stars across 3 layers")
     
+    @staticmethod
+    def _to_display_format(surface: pygame.Surface) -> pygame.Surface:
+        """Convert an opaque surface to the display pixel format once a display exists."""
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert()
+    
+    def _stretch_gradient_column(self, rows: list[tuple[int, int, int]]) -> pygame.Surface:
+        """
+        Build a full-size gradient from one color per row.
+        Only a 1×height column is created; transform.scale stretches it horizontally in C
+        (same pixels as one draw.line per row).
+        """
+        column = pygame.image.frombytes(
+            bytes(channel for color in rows for channel in color),
+            (1, self.height),
+            "RGB"
+        )
+        return pygame.transform.scale(column, (self.width, self.height))
+    
     def _create_static_background(self) -> None:
         """Create a clean static background gradient (no nebulas)."""
-        self.static_bg = pygame.Surface((self.width, self.height))
-        
         # Deep space gradient (top to bottom) - clean, no alpha blending
+        rows = []
         for y in range(self.height):
             ratio = y / self.height
             # Dark blue to almost black
             r = int(8 + 12 * (1 - ratio))
             g = int(10 + 15 * (1 - ratio))
             b = int(25 + 25 * (1 - ratio))
-            pygame.draw.line(self.static_bg, (r, g, b), (0, y), (self.width, y))
+            rows.append((r, g, b))
+        
+        self.static_bg = self._stretch_gradient_column(rows)
+        self.static_bg = self._to_display_format(self.static_bg)
     
     def _create_tension_background(self) -> None:
         """Create tension background with red/orange theme for high-stakes moments."""
         try:
-            self.tension_bg = pygame.Surface((self.width, self.height))
-            
             # Red/orange gradient (top to bottom) - intense, dramatic
+            rows = []
             for y in range(self.height):
                 ratio = y / self.height
                 # Dark red/orange to deep red-black
                 r = int(25 + 30 * (1 - ratio))
                 g = int(5 + 10 * (1 - ratio))
                 b = int(5 + 8 * (1 - ratio))
-                pygame.draw.line(self.tension_bg, (r, g, b), (0, y), (self.width, y))
+                rows.append((r, g, b))
+            
+            self.tension_bg = self._stretch_gradient_column(rows)
+            self.tension_bg = self._to_display_format(self.tension_bg)
         except Exception as e:
             logger.error(f"Failed to create tension background: {e}")
             self.tension_bg = None
@@ -385,55 +410,61 @@ class BackgroundManager:
             surface.fill((10, 10, 20))
         
         # Draw stars as crisp points (no glow for sharpness)
-        for star in self.stars:
-            # Subtle twinkle
-            twinkle = 0.8 + 0.2 * math.sin(self.time * 2.0 + star.twinkle_offset)
-            brightness = star.brightness * twinkle
-            
-            # Color based on layer and mode
-            if self.tension_mode:
-                # Red/orange stars in tension mode
-                if star.layer == 0:
-                    r = int(255 * brightness)
-                    g = int(120 * brightness)
-                    b = int(80 * brightness)
-                elif star.layer == 1:
-                    r = int(255 * brightness)
-                    g = int(150 * brightness)
-                    b = int(100 * brightness)
+        # Lock once for the whole star pass: set_at/draw.rect otherwise lock and
+        # unlock the surface on every call
+        surface.lock()
+        try:
+            for star in self.stars:
+                # Subtle twinkle
+                twinkle = 0.8 + 0.2 * math.sin(self.time * 2.0 + star.twinkle_offset)
+                brightness = star.brightness * twinkle
+                
+                # Color based on layer and mode
+                if self.tension_mode:
+                    # Red/orange stars in tension mode
+                    if star.layer == 0:
+                        r = int(255 * brightness)
+                        g = int(120 * brightness)
+                        b = int(80 * brightness)
+                    elif star.layer == 1:
+                        r = int(255 * brightness)
+                        g = int(150 * brightness)
+                        b = int(100 * brightness)
+                    else:
+                        r = int(255 * brightness)
+                        g = int(180 * brightness)
+                        b = int(120 * brightness)
                 else:
-                    r = int(255 * brightness)
-                    g = int(180 * brightness)
-                    b = int(120 * brightness)
-            else:
-                # Normal blue/white stars
-                if star.layer == 0:
-                    r = int(180 * brightness)
-                    g = int(190 * brightness)
-                    b = int(255 * brightness)
-                elif star.layer == 1:
-                    r = int(220 * brightness)
-                    g = int(220 * brightness)
-                    b = int(255 * brightness)
+                    # Normal blue/white stars
+                    if star.layer == 0:
+                        r = int(180 * brightness)
+                        g = int(190 * brightness)
+                        b = int(255 * brightness)
+                    elif star.layer == 1:
+                        r = int(220 * brightness)
+                        g = int(220 * brightness)
+                        b = int(255 * brightness)
+                    else:
+                        r = int(255 * brightness)
+                        g = int(250 * brightness)
+                        b = int(245 * brightness)
+                
+                # Draw star as crisp rectangle (1x1 or 2x2 pixel)
+                size = int(star.size)
+                if size <= 1:
+                    # Single pixel - direct set for maximum crispness
+                    ix, iy = int(star.x), int(star.y)
+                    if 0 <= ix < self.width and 0 <= iy < self.height:
+                        surface.set_at((ix, iy), (r, g, b))
                 else:
-                    r = int(255 * brightness)
-                    g = int(250 * brightness)
-                    b = int(245 * brightness)
-            
-            # Draw star as crisp rectangle (1x1 or 2x2 pixel)
-            size = int(star.size)
-            if size <= 1:
-                # Single pixel - direct set for maximum crispness
-                ix, iy = int(star.x), int(star.y)
-                if 0 <= ix < self.width and 0 <= iy < self.height:
-                    surface.set_at((ix, iy), (r, g, b))
-            else:
-                # Small rectangle for slightly larger stars
-                pygame.draw.rect(
-                    surface,
-                    (r, g, b),
-                    (int(star.x), int(star.y), size, size)
-                )
+                    # Small rectangle for slightly larger stars
+                    pygame.draw.rect(
+                        surface,
+                        (r, g, b),
+                        (int(star.x), int(star.y), size, size)
+                    )
+        finally:
+            surface.unlock()
     
     def _render_speed_lines(self, surface: pygame.Surface) -> None:
         """Render speed lines with crisp pygame.draw.line."""
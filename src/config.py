@@ -389,5 +389,11 @@ COUNTRY_KEYWORDS = {
     'italia': 'Italy', '🇮🇹': 'Italy',
 }
 
+# Índice inverso país → keywords (construido una sola vez al importar)
+COUNTRY_TO_KEYWORDS: dict[str, list[str]] = {}
+for _keyword, _country in COUNTRY_KEYWORDS.items():
+    COUNTRY_TO_KEYWORDS.setdefault(_country, []).append(_keyword)
+del _keyword, _country
+
 # Anti-spam para joins
 JOIN_NOTIFICATION_COOLDOWN = 5.0  # segundos entre notificaciones del mismo user
\ No newline at end of file
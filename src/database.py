@@ -1,5 +1,6 @@
 """Async SQLite database for event persistence."""
 
+import asyncio
 import aiosqlite
 import logging
 from datetime import datetime
@@ -13,15 +14,23 @@ logger = logging.getLogger(__name__)
 class Database:
     """Async SQLite database manager for storing TikTok events."""
     
+    # Writer en segundo plano: máximo de filas por lote y espera máxima antes de volcar
+    BATCH_MAX_SIZE: int = 200
+    BATCH_MAX_DELAY: float = 0.5
+    
     def __init__(self, db_path: str = DATABASE_PATH):
         self.db_path = db_path
         self._connection: Optional[aiosqlite.Connection] = None
+        # Filas pendientes de insertar (None = parar el writer tras vaciar la cola)
+        self._pending: asyncio.Queue[Optional[tuple]] = asyncio.Queue()
+        self._writer_task: Optional[asyncio.Task] = None
     
     async def connect(self) -> None:
         """Initialize the database connection and create tables."""
         try:
             self._connection = await aiosqlite.connect(self.db_path)
             await self._create_tables()
+            self._writer_task = asyncio.create_task(self._writer_loop())
             logger.info(f"Database connected: {self.db_path}")
         except Exception as e:
             logger.error(f"Database connection failed: {e}")
@@ -88,6 +97,73 @@ class Database:
             logger.error(f"Failed to save gift to database: {e}")
             return -1
     
+    def queue_event(
+        self,
+        user: str,
+        gift_name: str,
+        diamond_count: int,
+        gift_count: int = 1,
+        streamer: str = ""
+    ) -> None:
+        """
+        Queue a gift event for the background writer (non-blocking).
+        Rows are inserted in batches of up to BATCH_MAX_SIZE, at most
+        BATCH_MAX_DELAY seconds after they were queued.
+        """
+        self._pending.put_nowait((user, gift_name, diamond_count, gift_count, datetime.now(), streamer))
+    
+    async def _writer_loop(self) -> None:
+        """
+        Collect queued rows and insert them with one executemany + commit per batch.
+        The write of one batch runs as a task while the next batch is collected.
+        """
+        loop = asyncio.get_running_loop()
+        in_flight: Optional[asyncio.Task] = None
+        stopping = False
+        
+        while not stopping:
+            row = await self._pending.get()
+            if row is None:
+                break
+            
+            batch = [row]
+            deadline = loop.time() + self.BATCH_MAX_DELAY
+            while len(batch) < self.BATCH_MAX_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._pending.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                batch.append(row)
+            
+            # Un solo lote en vuelo: los commits no se entrelazan en la misma conexión
+            if in_flight:
+                await in_flight
+            in_flight = asyncio.create_task(self._write_batch(batch))
+        
+        if in_flight:
+            await in_flight
+    
+    async def _write_batch(self, batch: list[tuple]) -> None:
+        """Insert a batch of gift rows in a single transaction."""
+        try:
+            await self._connection.executemany(
+                """
+                INSERT INTO gift_logs (username, gift_name, diamond_count, gift_count, timestamp, streamer)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                batch
+            )
+            await self._connection.commit()
+            logger.debug(f"DB: {len(batch)} gift events saved")
+        except Exception as e:
+            logger.error(f"Failed to save {len(batch)} gifts to database: {e}")
+    
     async def get_top_gifters(self, limit: int = 10) -> list[tuple]:
         """Get top gifters by total diamond value."""
         cursor = await self._connection.execute(
@@ -123,7 +199,12 @@ class Database:
         }
     
     async def close(self) -> None:
-        """Close the database connection."""
+        """Close the database connection (after flushing queued events)."""
+        if self._writer_task:
+            # El sentinel llega detrás de las filas pendientes → se escriben antes de cerrar
+            self._pending.put_nowait(None)
+            await self._writer_task
+            self._writer_task = None
         if self._connection:
             await self._connection.close()
             logger.info("Database connection closed")
\ No newline at end of file
@@ -1,8 +1,11 @@
 """Game Engine - Consumer that renders TikTok events using Pygame + Pymunk."""
 
 import asyncio
+import functools
+from collections import deque
 import logging
-from typing import Optional, Dict
+import re
+from typing import Callable, ClassVar, Optional, Dict
 import math
 import random
 import time
@@ -11,7 +14,6 @@ from .cloud_manager import CloudManager
 from dataclasses import dataclass
 
 import pygame
-import pymunk
 
 # Try to import psutil for memory monitoring (optional)
 try:
@@ -45,6 +47,16 @@ from .config import (
     FLOATING_TEXT_SPEED,
     FLOATING_TEXT_LIFESPAN,
     FLOATING_TEXT_FONT_SIZE,
+    # Idle screen
+    GAME_MODE,
+    COUNTRY_ABBREV,
+    # Team joins / comment mode (usados en handlers por evento)
+    JOIN_NOTIFICATION_COOLDOWN,
+    COMMENT_POINTS_PER_MESSAGE,
+    COMMENT_COOLDOWN,
+    COUNTRY_TO_KEYWORDS,
+    # Render
+    GAME_MARGIN,
 )
 from .events import EventType, ConnectionState, GameEvent
 from .physics_world import PhysicsWorld
@@ -56,15 +68,174 @@ from .background_manager import BackgroundManager
 
 logger = logging.getLogger(__name__)
 
+# Colores fijos de partículas además de los de cada bandera: oro (premium/victoria),
+# blanco (chispas de colisión) y azul hielo (freeze)
+PARTICLE_EFFECT_COLORS = frozenset({
+    (255, 215, 0),
+    (255, 255, 255),
+    (100, 200, 255),
+})
 
-@dataclass
+# Regex de emojis compilado una sola vez (antes se recompilaba en cada render)
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F1E0-\U0001F1FF"  # flags
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F680-\U0001F6FF"  # transport & map
+    "\U0001F700-\U0001F77F"  # alchemical
+    "\U0001F780-\U0001F7FF"  # geometric
+    "\U0001F800-\U0001F8FF"  # supplemental arrows
+    "\U0001F900-\U0001F9FF"  # supplemental symbols
+    "\U0001FA00-\U0001FA6F"  # chess symbols
+    "\U0001FA70-\U0001FAFF"  # symbols extended
+    "\U00002702-\U000027B0"  # dingbats
+    "\U0001F004-\U0001F0CF"  # playing cards
+    "]+"
+)
+
+
+# Cooldown anti-spam de joins en ns enteros (comparado contra time.monotonic_ns())
+_JOIN_NOTIFICATION_COOLDOWN_NS = int(JOIN_NOTIFICATION_COOLDOWN * 1_000_000_000)
+
+
+# Cada diamante avanza 0.8 unidades de distancia → multiplicar por la inversa
+# (1.25 es exacto en coma flotante; 0.8 no lo es y truncaba p.ej. 2.4 / 0.8 a 2)
+_INV_DIAMOND_SIZE = 1.25
+
+
+# Tabla de senos para animaciones (1024 muestras por vuelta; índice con máscara de bits)
+_SIN_LUT_SIZE = 1024
+_SIN_LUT_SCALE = _SIN_LUT_SIZE / (2 * math.pi)
+_SIN_LUT = [math.sin(2 * math.pi * i / _SIN_LUT_SIZE) for i in range(_SIN_LUT_SIZE)]
+# Vectores unitarios (cos, sin) por índice de la misma tabla: dirección aleatoria en una lectura
+_DIR_LUT = [
+    (_SIN_LUT[(i + (_SIN_LUT_SIZE >> 2)) & (_SIN_LUT_SIZE - 1)], _SIN_LUT[i])
+    for i in range(_SIN_LUT_SIZE)
+]
+
+# Direcciones fijas del spotlight del ganador (8 rayos, 10 estrellas); por frame solo se rota la base
+_SPOTLIGHT_RAY_DIRS = [(math.cos(i * 2 * math.pi / 8), math.sin(i * 2 * math.pi / 8)) for i in range(8)]
+_SPOTLIGHT_STAR_DIRS = [(math.cos(i * 2 * math.pi / 10), math.sin(i * 2 * math.pi / 10)) for i in range(10)]
+# Desfase del parpadeo de cada estrella (fase i radianes): (cos i, sin i)
+_SPOTLIGHT_TWINKLE_PHASES = [(math.cos(i), math.sin(i)) for i in range(10)]
+
+# Rango Unicode de los "regional indicators" (una bandera = pareja de ellos)
+_REGIONAL_INDICATOR_MIN = "\U0001F1E6"
+_REGIONAL_INDICATOR_MAX = "\U0001F1FF"
+
+
+def _lut_sin(x: float) -> float:
+    """Approximate math.sin(x) for x >= 0 via the precomputed table (good enough for animation)."""
+    return _SIN_LUT[int(x * _SIN_LUT_SCALE) & (_SIN_LUT_SIZE - 1)]
+
+
+def _vertical_gradient_surface(
+    width: int,
+    height: int,
+    top: tuple[int, int, int],
+    bottom: tuple[int, int, int],
+    alpha: Optional[int] = None
+) -> pygame.Surface:
+    """
+    Build a vertical linear gradient surface.
+    Only a 1×height column is computed in Python; transform.scale replicates it
+    horizontally in C. Rows match the per-row draw.line loops pixel for pixel.
+    If alpha is given the result is an RGBA (per-pixel alpha) surface.
+    """
+    buf = bytearray()
+    for y in range(height):
+        ratio = y / height
+        buf.extend((
+            int(top[0] + (bottom[0] - top[0]) * ratio),
+            int(top[1] + (bottom[1] - top[1]) * ratio),
+            int(top[2] + (bottom[2] - top[2]) * ratio),
+        ))
+        if alpha is not None:
+            buf.append(alpha)
+    
+    column = pygame.image.frombytes(bytes(buf), (1, height), "RGB" if alpha is None else "RGBA")
+    return pygame.transform.scale(column, (width, height))
+
+
+@functools.lru_cache(maxsize=256)
+def _compose_outlined_text(
+    text: str,
+    font: pygame.font.Font,
+    color: tuple[int, int, int],
+    outline_color: tuple[int, int, int],
+    outline_width: int
+) -> pygame.Surface:
+    """
+    Build (and memoize) the outlined text composite used by _render_text_enhanced.
+    The font object is part of the key, so the cache keeps it alive and a
+    recycled id() can never map to a different font.
+    """
+    # Render main text with anti-aliasing (True)
+    main_text = font.render(text, True, color)
+    
+    if outline_width <= 0:
+        return main_text.convert_alpha()
+    
+    # Outline = dilatación del glifo: Mask.convolve con un kernel cuadrado (2w+1)²
+    # equivale a estampar el glifo en todos los offsets, pero en una sola pasada en C.
+    # El resultado ya mide (ancho + 2w, alto + 2w) y queda alineado con el composite.
+    glyph_mask = pygame.mask.from_surface(main_text)
+    kernel = pygame.mask.Mask((outline_width * 2 + 1, outline_width * 2 + 1), fill=True)
+    composite = glyph_mask.convolve(kernel).to_surface(
+        setcolor=(*outline_color, 255),
+        unsetcolor=(0, 0, 0, 0)
+    )
+    
+    # Draw main text on top
+    composite.blit(main_text, (outline_width, outline_width))
+    # Formato del display → blits por la ruta SIMD de SDL (la conversión se paga una vez)
+    return composite.convert_alpha()
+
+
+@functools.lru_cache(maxsize=128)
+def _compose_shadowed_text(
+    text: str,
+    font: pygame.font.Font,
+    color: tuple[int, int, int],
+    shadow_offset: int,
+    shadow_color: tuple[int, int, int],
+    shadow_alpha: int
+) -> pygame.Surface:
+    """Build (and memoize) the drop-shadow text composite used by _render_text_with_shadow."""
+    main_text = font.render(text, True, color)
+    shadow_text = font.render(text, True, shadow_color)
+    
+    # Create surface with room for shadow
+    text_width, text_height = main_text.get_size()
+    width = text_width + shadow_offset + 2
+    height = text_height + shadow_offset + 2
+    
+    composite = pygame.Surface((width, height), pygame.SRCALPHA)
+    
+    # Draw shadow with alpha
+    shadow_surf = pygame.Surface(shadow_text.get_size(), pygame.SRCALPHA)
+    shadow_surf.blit(shadow_text, (0, 0))
+    shadow_surf.set_alpha(shadow_alpha)
+    composite.blit(shadow_surf, (shadow_offset, shadow_offset))
+    
+    # Draw main text on top
+    composite.blit(main_text, (0, 0))
+    
+    return composite
+
+
+@dataclass(slots=True)
 class Particle:
     """
     Professional particle system for juice effects.
-    Uses Pymunk vectors for physics consistency.
+    Position and velocity are plain floats (no pymunk.Vec2d per step), so the
+    per-frame integration allocates nothing.
     """
-    pos: pymunk.Vec2d  # Position vector
-    vel: pymunk.Vec2d  # Velocity vector
+    x: float           # Position X
+    y: float           # Position Y
+    vx: float          # Velocity X
+    vy: float          # Velocity Y
     color: tuple[int, int, int]
     radius: float      # Current radius
     initial_radius: float  # Initial radius for scaling
@@ -160,14 +331,14 @@ class ParticleManager:
     
     def __init__(self):
         """Initialize the particle manager."""
-        # Trail particles: country -> list of trail particles
-        self.trail_particles: dict[str, list[TrailParticle]] = {}
+        # Trail particles: country -> ring buffer of trail particles (deque con maxlen)
+        self.trail_particles: dict[str, deque[TrailParticle]] = {}
         # Trail configuration
         self.trail_max_particles = 20  # Max particles per trail
         self.trail_lifetime = 0.5  # Seconds
         # Increased particle density by 20%: 0.05 * 0.8 = 0.04 (spawns more frequently)
-        self.trail_spawn_interval = 0.04  # Spawn every 0.04s (was 0.05s)
-        self.trail_last_spawn: dict[str, float] = {}  # country -> last spawn time
+        self.trail_spawn_interval_ms = 40  # Spawn every 40ms (was 50ms)
+        self.trail_last_spawn: dict[str, int] = {}  # country -> last spawn time (pygame ticks, ms)
     
     def update_trail(self, country: str, pos: tuple[float, float], color: tuple[int, int, int], dt: float) -> None:
         """
@@ -179,49 +350,65 @@ class ParticleManager:
             color: Flag color for trail
             dt: Delta time since last frame
         """
-        current_time = time.time()
-        
-        # Initialize trail if needed
-        if country not in self.trail_particles:
-            self.trail_particles[country] = []
-            self.trail_last_spawn[country] = current_time
-        
-        # Spawn new trail particle if enough time has passed
-        if current_time - self.trail_last_spawn[country] >= self.trail_spawn_interval:
-            # Create trail particle with random size (2-5px) for organic look
-            import random
-            random_size = random.uniform(2.0, 5.0)  # Random size for organic trail effect
-            trail_particle = TrailParticle(
-                pos=pos,
-                color=color,
-                alpha=180,  # Start with good visibility
-                size=random_size,  # Current size (starts at random)
-                initial_size=random_size,  # Store initial size for fade calculation
-                lifetime=self.trail_lifetime
-            )
-            
-            self.trail_particles[country].append(trail_particle)
-            self.trail_last_spawn[country] = current_time
-            
-            # Limit trail length
-            if len(self.trail_particles[country]) > self.trail_max_particles:
-                self.trail_particles[country].pop(0)
-        
-        # Update existing trail particles
-        particles_to_keep = []
-        for particle in self.trail_particles[country]:
-            # Update lifetime
-            particle.lifetime -= dt
-            
-            if particle.lifetime > 0:
-                # Fade out over time
-                life_ratio = particle.lifetime / self.trail_lifetime if self.trail_lifetime > 0 else 0
-                particle.alpha = int(180 * life_ratio)
-                # Fade size proportionally to lifetime, preserving initial random variation
-                particle.size = particle.initial_size * life_ratio
-                particles_to_keep.append(particle)
+        self.update_trails(((country, pos, color),), dt)
+    
+    def update_trails(self, flags, dt: float) -> None:
+        """
+        Update the trails of several flags in one pass (one clock read, constants hoisted).
         
-        self.trail_particles[country] = particles_to_keep
+        Args:
+            flags: Iterable of (country, (x, y), color) tuples
+            dt: Delta time since last frame
+        """
+        # Reloj monotónico en ms enteros de SDL (time.time() puede saltar con ajustes NTP)
+        current_time = pygame.time.get_ticks()
+        
+        trails = self.trail_particles
+        last_spawn = self.trail_last_spawn
+        spawn_interval = self.trail_spawn_interval_ms
+        trail_lifetime = self.trail_lifetime
+        inv_lifetime = 1.0 / trail_lifetime if trail_lifetime > 0 else 0.0
+        uniform = random.uniform
+        
+        for country, pos, color in flags:
+            trail = trails.get(country)
+            
+            # Initialize trail if needed
+            if trail is None:
+                # maxlen: al superar el límite se descarta la más antigua en O(1)
+                trail = trails[country] = deque(maxlen=self.trail_max_particles)
+                last_spawn[country] = current_time
+            
+            # Spawn new trail particle if enough time has passed
+            if current_time - last_spawn[country] >= spawn_interval:
+                # Create trail particle with random size (2-5px) for organic look
+                random_size = uniform(2.0, 5.0)  # Random size for organic trail effect
+                trail.append(TrailParticle(
+                    pos=pos,
+                    color=color,
+                    alpha=180,  # Start with good visibility
+                    size=random_size,  # Current size (starts at random)
+                    initial_size=random_size,  # Store initial size for fade calculation
+                    lifetime=trail_lifetime
+                ))
+                last_spawn[country] = current_time
+            
+            # Update existing trail particles
+            for particle in trail:
+                # Update lifetime
+                lifetime = particle.lifetime - dt
+                particle.lifetime = lifetime
+                
+                if lifetime > 0:
+                    # Fade out over time
+                    life_ratio = lifetime * inv_lifetime
+                    particle.alpha = int(180 * life_ratio)
+                    # Fade size proportionally to lifetime, preserving initial random variation
+                    particle.size = particle.initial_size * life_ratio
+            
+            # Todas nacen con la misma vida → las muertas siempre están al principio
+            while trail and trail[0].lifetime <= 0:
+                trail.popleft()
     
     def clear_trail(self, country: str) -> None:
         """Clear trail for a specific country."""
@@ -234,7 +421,52 @@ class ParticleManager:
         self.trail_last_spawn.clear()
 
 
-@dataclass
+@functools.lru_cache(maxsize=128)
+def _compose_floating_text(text: str, color: tuple[int, int, int], font_size: int) -> pygame.Surface:
+    """
+    Build (and memoize) a floating text with its 2px black outline already fused in.
+    The outline glyph is rendered once without anti-aliasing (its soft edges would be
+    covered anyway) and stamped at the 24 offsets a single time.
+    """
+    font = FloatingText.get_font(font_size)
+    text_surface = font.render(text, True, color)
+    outline_surface = font.render(text, False, (0, 0, 0))
+    
+    width, height = text_surface.get_size()
+    composite = pygame.Surface((width + 4, height + 4), pygame.SRCALPHA)
+    
+    # Outline en 8 direcciones con DOBLE grosor
+    composite.blits(
+        [
+            (outline_surface, (2 + dx, 2 + dy))
+            for dx in range(-2, 3)
+            for dy in range(-2, 3)
+            if dx != 0 or dy != 0
+        ],
+        doreturn=False
+    )
+    composite.blit(text_surface, (2, 2))
+    return composite.convert_alpha()
+
+
+@functools.lru_cache(maxsize=256)
+def _floating_text_surface(
+    text: str,
+    color: tuple[int, int, int],
+    font_size: int,
+    alpha: int
+) -> pygame.Surface:
+    """
+    Return the fused floating text with surface alpha applied.
+    Each alpha level gets its own copy so two live texts sharing a composite can be
+    submitted in the same blits() call with different fades.
+    """
+    surface = _compose_floating_text(text, color, font_size).copy()
+    surface.set_alpha(alpha)
+    return surface
+
+
+@dataclass(slots=True)
 class FloatingText:
     """
     Floating action text for visual feedback.
@@ -250,6 +482,22 @@ class FloatingText:
     max_lifespan: int = 60     # Para calcular alpha
     font_size: int = 16
     
+    # Fuentes compartidas por tamaño (SysFont busca/abre archivos: crear una vez)
+    _font_cache: ClassVar[dict[int, pygame.font.Font]] = {}
+    
+    @classmethod
+    def get_font(cls, size: int) -> pygame.font.Font:
+        """Return the bold Arial font for `size`, creating it on first use."""
+        font = cls._font_cache.get(size)
+        if font is None:
+            # Create font con BOLD para mejor legibilidad
+            try:
+                font = pygame.font.SysFont("Arial", size, bold=True)
+            except:
+                font = pygame.font.Font(None, size)
+            cls._font_cache[size] = font
+        return font
+    
     def update(self) -> None:
         """Update position and lifespan."""
         self.y += self.dy
@@ -257,8 +505,17 @@ class FloatingText:
     
     def draw(self, surface: pygame.Surface) -> None:
         """Render the floating text with fade and elastic pulse effect."""
+        blit_items = self.get_blit_items()
+        if blit_items:
+            surface.blits(blit_items, doreturn=False)
+    
+    def get_blit_items(self) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        """
+        Build the (surface, position) pairs for this frame.
+        Lets the engine submit every floating text in one blits().
+        """
         if self.lifespan <= 0:
-            return
+            return []
         
         # Calculate alpha
         alpha = int(255 * (self.lifespan / self.max_lifespan)) if self.max_lifespan > 0 else 0
@@ -278,39 +535,10 @@ class FloatingText:
         # Calculate actual font size with pulse
         actual_font_size = max(8, int(self.font_size * scale))
         
-        # Create font con BOLD para mejor legibilidad
-        try:
-            font = pygame.font.SysFont("Arial", actual_font_size, bold=True)
-        except:
-            font = pygame.font.Font(None, actual_font_size)
-    
-        # Render main text con anti-aliasing
-        text_surface = font.render(self.text, True, self.color)
-    
-        # Apply alpha
-        temp_surface = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
-        temp_surface.fill((255, 255, 255, alpha))
-        text_surface = text_surface.copy()
-        text_surface.blit(temp_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-    
-        rect = text_surface.get_rect(center=(int(self.x), int(self.y)))
-    
-        # Outline MÁS GRUESO (era 1px en diagonal, ahora 2px)
-        outline_color = (0, 0, 0)
-        outline_surface = font.render(self.text, True, outline_color)
-        outline_temp = pygame.Surface(outline_surface.get_size(), pygame.SRCALPHA)
-        outline_temp.fill((255, 255, 255, alpha))
-        outline_surface = outline_surface.copy()
-        outline_surface.blit(outline_temp, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-    
-        # Outline en 8 direcciones con DOBLE grosor
-        for dx in range(-2, 3):
-            for dy in range(-2, 3):
-                if dx != 0 or dy != 0:
-                    surface.blit(outline_surface, (rect.x + dx, rect.y + dy))
-    
-        # Draw main text
-        surface.blit(text_surface, rect)
+        # Outline + texto ya fusionados en una sola superficie; alpha cuantizado a 16 niveles
+        composite = _floating_text_surface(self.text, self.color, actual_font_size, (alpha >> 4) << 4 | 15)
+        rect = composite.get_rect(center=(int(self.x), int(self.y)))
+        return [(composite, rect.topleft)]
     
     @property
     def is_alive(self) -> bool:
@@ -328,6 +556,25 @@ class GameEngine:
     # Maximum number of floating texts rendered at once
     MAX_FLOATING_TEXTS: int = 10
     
+    # Maximum number of live explosion particles (fixed pool size)
+    MAX_PARTICLES: int = 4096
+    
+    # Position history length for ON FIRE motion trails (ring buffer size)
+    MOTION_TRAIL_MAX_HISTORY: int = 15
+    
+    # Maximum number of queued events handled per frame (the rest wait for the next one)
+    MAX_EVENTS_PER_FRAME: int = 256
+    
+    # Discrete steps (in total, 0.95 → 1.05) for the idle "breathing" text scale
+    BREATHE_LEVELS: int = 16
+    
+    # Maximum contributors tracked per country in session_points (lowest total evicted)
+    MAX_TRACKED_USERS_PER_COUNTRY: int = 1024
+    
+    # Rotated sprite cache: angle bucket size (degrees) and max cached surfaces (FIFO)
+    ROTATION_STEP_DEGREES: int = 2
+    ROTATION_CACHE_MAX: int = 4096
+    
     def __init__(
         self, 
         queue: asyncio.Queue, 
@@ -340,7 +587,8 @@ class GameEngine:
         self.cloud_manager = CloudManager()
         self.running = True
         
-        self.messages: list[tuple[str, EventType]] = []
+        # Mensajes ya renderizados: (text_surface, event_type)
+        self.messages: deque[tuple[pygame.Surface, EventType]] = deque(maxlen=MAX_MESSAGES)
         self.connection_state = ConnectionState.DISCONNECTED
         
         # Country assignment system
@@ -423,14 +671,36 @@ class GameEngine:
             game_engine=self
         )
         
+        # Países en orden de carril (los racers se crean una sola vez): para las teclas de test
+        self._racer_countries: tuple[str, ...] = tuple(self.physics_world.racers)
+        
+        # Y central de cada carril por país (geometría fija: racers y carriles se crean una vez)
+        pw = self.physics_world
+        self._lane_y: dict[str, int] = {
+            country: pw.game_area_top + racer.lane * pw.lane_height + pw.lane_height // 2
+            for country, racer in pw.racers.items()
+        }
+        
         # Particle system
         self.particles: list[Particle] = []
+        # Pool de partículas muertas: se reutilizan en emit_explosion en vez de crear nuevas
+        self._particle_pool: list[Particle] = []
+        # Atlas de sprites de partículas: (color, radius, alpha) -> Surface pre-renderizada
+        self._particle_sprites: dict[tuple, pygame.Surface] = {}
+        # Paleta cerrada de colores de partícula (colores de bandera + efectos fijos):
+        # mantiene el atlas acotado y con reutilización total
+        self._particle_palette: frozenset[tuple[int, int, int]] = frozenset(
+            racer.color for racer in self.physics_world.racers.values()
+        ) | PARTICLE_EFFECT_COLORS
         
         # Particle Manager (trails and explosions)
         self.particle_manager = ParticleManager()
         
         # Floating texts
-        self.floating_texts: list[FloatingText] = []
+        # deque con maxlen: al añadir por encima del límite se descarta el más antiguo
+        self.floating_texts: deque[FloatingText] = deque(maxlen=self.MAX_FLOATING_TEXTS)
+        # Textos flotantes retirados, listos para reutilizar (sin asignar por evento)
+        self._floating_text_pool: list[FloatingText] = []
         
         self.screen: Optional[pygame.Surface] = None
         self.font: Optional[pygame.font.Font] = None
@@ -440,6 +710,52 @@ class GameEngine:
         self.header_height = 30          # era 70, ahora 70 * 0.42 ≈ 30
         self.message_area_height = 70   # Reducido de 105 a 70
         
+        # Dirty rects: rect del área de juego dentro de la ventana y flag de margen sucio
+        self._game_area_rect: Optional[pygame.Rect] = None
+        self._outer_background_dirty = True
+        # Posición fija del área de juego en la ventana (sin shake)
+        self._game_margin_pos = (GAME_MARGIN, GAME_MARGIN)
+        
+        # LUT de escalas de "respiración": (surface, level) -> Surface escalada
+        self._breathe_cache: dict[tuple[pygame.Surface, int], pygame.Surface] = {}
+        
+        # Etiquetas estáticas de cada racer (número + abreviatura): country -> (número, abreviatura)
+        self._racer_label_surfaces: dict[str, tuple[pygame.Surface, pygame.Surface]] = {}
+        # Etiqueta de capitán por país: country -> ((capitán, resaltado), Surface)
+        self._captain_label_cache: dict[str, tuple[tuple[str, bool], pygame.Surface]] = {}
+        self._no_captain_surface: Optional[pygame.Surface] = None
+        # Piezas estáticas del HUD (header y leyenda), compuestas en el primer uso
+        self._header_bg: Optional[pygame.Surface] = None
+        self._legend_static: Optional[pygame.Surface] = None
+        # Panel de clasificación final: (filas mostradas, Surface compuesta)
+        self._leaderboard_cache_key: Optional[tuple] = None
+        self._leaderboard_cache_surf: Optional[pygame.Surface] = None
+        # Nombres de país del panel final ya truncados y rasterizados (la lista de países es fija)
+        self._country_label_cache: dict[str, pygame.Surface] = {}
+        # Franja a cuadros de la meta (solo depende del tamaño de casilla)
+        self._finish_line_surf: Optional[pygame.Surface] = None
+        # Separadores de carril (el layout de la pista es fijo desde que se crea PhysicsWorld)
+        self._lanes_surf: Optional[pygame.Surface] = None
+        
+        # Superficies estáticas de la pantalla IDLE (overlay en init_pygame, resto en el primer uso)
+        self._idle_overlay: Optional[pygame.Surface] = None
+        self._idle_box_surface: Optional[pygame.Surface] = None
+        self._idle_fonts: Optional[dict[str, pygame.font.Font]] = None
+        self._cached_winner_key: Optional[tuple] = None
+        self._cached_winner_surfaces: Optional[tuple[pygame.Surface, pygame.Surface]] = None
+        # Panel IDLE con todo lo estático ya compuesto (solo cambia con el ganador)
+        self._idle_frame_key: Optional[tuple] = None
+        self._idle_frame_cache: Optional[pygame.Surface] = None
+        # Textos que "respiran": (surface base, centro y relativo al panel); se escalan al blitear
+        self._idle_breathe_texts: list[tuple[pygame.Surface, int]] = []
+        
+        # Cache de la franja de mensajes (se reconstruye solo cuando _add_message la marca sucia)
+        self._messages_dirty = True
+        self._msg_cache_surf: Optional[pygame.Surface] = None
+        
+        # Pool de superficies SRCALPHA temporales por tamaño (ver _acquire_surface/_release_surface)
+        self._surface_pool: dict[tuple[int, int], list[pygame.Surface]] = {}
+        
         # Rendering surfaces
         self.render_surface: Optional[pygame.Surface] = None
         self.display_scale = 1.0
@@ -448,6 +764,14 @@ class GameEngine:
         self.winner_animation_time = 0.0
         self.winner_scale_pulse = 1.0
         self.winner_glow_alpha = 0
+        # Anillos del spotlight pre-rasterizados por radio entero (acotado por la geometría del pulso)
+        self._winner_ring_cache: dict[tuple[int, int], pygame.Surface] = {}
+        # Capa de rayos del spotlight (se reutiliza; solo crece si el radio lo exige)
+        self._winner_ray_surf: Optional[pygame.Surface] = None
+        # Estrellas del spotlight pre-dibujadas por (tamaño, color); el twinkle solo usa ~6 tamaños
+        self._star_cache: dict[tuple[int, tuple[int, int, int]], pygame.Surface] = {}
+        # Sprites rotados por (sprite, bucket de ángulo); la bola rueda, 2° no se nota
+        self._rotated_cache: dict[tuple[pygame.Surface, int], pygame.Surface] = {}
         
         # Auto stress test system
         self.stress_test_timer = 0.0
@@ -468,13 +792,18 @@ class GameEngine:
         # Keyword Binding system
         self.user_assignments: dict[str, str] = {}  # username -> country
         self.users_notified: set[str] = set()       # Anti-spam para joins
-        self.last_join_time: dict[str, float] = {}  # username -> timestamp
+        self.last_join_time_ns: dict[str, int] = {}  # username -> time.monotonic_ns() del último join
 
         # Captain/MVP System
         self.session_points: dict[str, dict[str, int]] = {}  # {country: {username: points}}
         self.current_captains: dict[str, str] = {}           # {country: username}
+        self._country_best: dict[str, tuple[str, int]] = {}  # {country: (mvp, points)} mantenido en O(1)
         self.captain_change_timer: dict[str, int] = {}       # {country: frames_remaining}
         
+        # Fuentes SysFont memoizadas por (nombre, tamaño, negrita) → ver _font()
+        self._font_cache: dict[tuple[str, int, bool], pygame.font.Font] = {}
+        self._emoji_font_cache: dict[int, pygame.font.Font] = {}
+        
         # Cloud sync control
         self.race_synced = False  # Flag to prevent multiple syncs per race
         
@@ -539,7 +868,7 @@ class GameEngine:
         
         # 🌈 MOTION TRAILS (replaces fire_particles for crisp neon effect)
         self.motion_trails: dict[str, list[MotionTrailSegment]] = {}  # {country: [segments]}
-        self.motion_trail_history: dict[str, list[tuple[float, float]]] = {}  # Position history
+        self.motion_trail_history: dict[str, deque[tuple[float, float]]] = {}  # Position history (ring buffer)
         self.max_trail_segments = 20  # Max segments per country
         self.trail_segment_lifetime = 0.3  # Seconds before fade
         
@@ -574,6 +903,22 @@ class GameEngine:
         self._esc_quit_time: float = 0.0
         self._esc_quit_window = 2.0  # Seconds to press ESC again to confirm
         
+        # ⌨️ Teclas de control/test → handler (despacho en handle_pygame_events)
+        self._key_handlers: dict[int, Callable[[], None]] = {
+            pygame.K_c: self._reset_to_idle_key,
+            pygame.K_r: self._reset_to_idle_key,
+            pygame.K_t: functools.partial(self._test_gift, "Test Gift", 1, 10, "TEST"),
+            pygame.K_y: functools.partial(self._test_gift, "Big Test Gift", 25, 50, "TEST BIG"),
+            pygame.K_1: self._test_key_1,
+            pygame.K_2: self._test_key_2,
+            pygame.K_3: self._test_key_3,
+            pygame.K_j: self._test_join,
+            pygame.K_k: self._toggle_stress_test,
+            pygame.K_f: self._test_fire,
+            pygame.K_g: self._test_final_stretch,
+            pygame.K_v: self._test_victory,
+        }
+        
         # 📊 PERFORMANCE MONITORING
         self._fps_samples: list[float] = []  # FPS samples for averaging
         self._fps_sample_times: list[float] = []  # Timestamps for each sample
@@ -603,7 +948,7 @@ class GameEngine:
             
             from .config import (
                 ACTUAL_WIDTH, ACTUAL_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT,
-                GRADIENT_TOP, GRADIENT_BOTTOM
+                GRADIENT_TOP, GRADIENT_BOTTOM, GAME_MARGIN
             )
             logger.info(f"🔧 Config loaded: {ACTUAL_WIDTH}x{ACTUAL_HEIGHT}")
             
@@ -615,8 +960,10 @@ class GameEngine:
             logger.info("🔧 Display mode set")
             
             # Render to inner game surface, then blit with margin
-            self.render_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            # .convert() → mismo pixel format que el display (blit final sin conversión)
+            self.render_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
             self.display_scale = 1.0
+            self._game_area_rect = pygame.Rect(GAME_MARGIN, GAME_MARGIN, SCREEN_WIDTH, SCREEN_HEIGHT)
             self.clock = pygame.time.Clock()
             logger.info("🔧 Clock created")
             
@@ -645,6 +992,16 @@ class GameEngine:
             self.outer_background = self._create_outer_background()
             logger.info("🔧 Gradients created")
             
+            # Overlay de pantalla completa del leaderboard final (se reutiliza cada frame).
+            # Equivale a los dos oscurecidos apilados de antes (alpha 140 + 180): 1 - (115/255)(75/255) ≈ 221/255
+            self._race_finished_overlay = self._create_dim_overlay(221)
+            # Overlay oscuro de la pantalla IDLE (alpha 150, antes 180)
+            self._idle_overlay = self._create_dim_overlay(150)
+            
+            # Etiquetas estáticas de los racers (número + abreviatura): rasterizadas una vez aquí
+            for racer in self.physics_world.racers.values():
+                self._get_racer_label_surfaces(racer)
+            
             # 🌌 Initialize parallax background manager
             logger.info("🔧 Creating parallax background...")
             self.background_manager = BackgroundManager(SCREEN_WIDTH, SCREEN_HEIGHT)
@@ -655,6 +1012,9 @@ class GameEngine:
             self._render_flag_emojis()
             logger.info("🔧 Emojis rendered")
             
+            # Convertir sprites al formato del display (AssetManager los carga sin display)
+            self._convert_racer_sprites()
+            
             logger.info("🔧 Starting BGM...")
             self.audio_manager.play_bgm()
             
@@ -674,20 +1034,36 @@ class GameEngine:
         """
         from .config import GRADIENT_TOP, GRADIENT_BOTTOM, SCREEN_WIDTH, SCREEN_HEIGHT
         
-        gradient_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        
-        # Draw gradient line by line
-        for y in range(SCREEN_HEIGHT):
-            # Linear interpolation between top and bottom colors
-            ratio = y / SCREEN_HEIGHT
-            r = int(GRADIENT_TOP[0] + (GRADIENT_BOTTOM[0] - GRADIENT_TOP[0]) * ratio)
-            g = int(GRADIENT_TOP[1] + (GRADIENT_BOTTOM[1] - GRADIENT_TOP[1]) * ratio)
-            b = int(GRADIENT_TOP[2] + (GRADIENT_BOTTOM[2] - GRADIENT_TOP[2]) * ratio)
-            
-            pygame.draw.line(gradient_surf, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        # Linear interpolation between top and bottom colors (una columna, escalada en C)
+        gradient_surf = _vertical_gradient_surface(SCREEN_WIDTH, SCREEN_HEIGHT, GRADIENT_TOP, GRADIENT_BOTTOM)
         
         logger.info("✨ Gradient background created (static surface)")
-        return gradient_surf
+        # Formato del display: el blit de fondo completo no convierte píxel a píxel
+        return gradient_surf.convert()
+
+    def _acquire_surface(self, width: int, height: int, clear: bool = True) -> pygame.Surface:
+        """
+        Get a SRCALPHA scratch surface of the given size from the pool (or a new one).
+        Pass clear=False when the caller overwrites every pixel anyway.
+        Hand it back with _release_surface once it has been blitted.
+        """
+        free = self._surface_pool.get((width, height))
+        if free:
+            surf = free.pop()
+            if clear:
+                surf.fill((0, 0, 0, 0))
+            return surf
+        return pygame.Surface((width, height), pygame.SRCALPHA)
+    
+    def _release_surface(self, surf: pygame.Surface) -> None:
+        """Return a scratch surface obtained from _acquire_surface to the pool."""
+        self._surface_pool.setdefault(surf.get_size(), []).append(surf)
+
+    def _create_dim_overlay(self, alpha: int) -> pygame.Surface:
+        """Create a full-screen black overlay with the given alpha."""
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, alpha))
+        return overlay.convert_alpha()
 
     def _create_outer_background(self) -> pygame.Surface:
         """
@@ -698,17 +1074,12 @@ class GameEngine:
         """
         from .config import OUTER_GRADIENT_TOP, OUTER_GRADIENT_BOTTOM, ACTUAL_WIDTH, ACTUAL_HEIGHT
         
-        outer_surf = pygame.Surface((ACTUAL_WIDTH, ACTUAL_HEIGHT))
-        
-        for y in range(ACTUAL_HEIGHT):
-            ratio = y / ACTUAL_HEIGHT
-            r = int(OUTER_GRADIENT_TOP[0] + (OUTER_GRADIENT_BOTTOM[0] - OUTER_GRADIENT_TOP[0]) * ratio)
-            g = int(OUTER_GRADIENT_TOP[1] + (OUTER_GRADIENT_BOTTOM[1] - OUTER_GRADIENT_TOP[1]) * ratio)
-            b = int(OUTER_GRADIENT_TOP[2] + (OUTER_GRADIENT_BOTTOM[2] - OUTER_GRADIENT_TOP[2]) * ratio)
-            pygame.draw.line(outer_surf, (r, g, b), (0, y), (ACTUAL_WIDTH, y))
+        outer_surf = _vertical_gradient_surface(
+            ACTUAL_WIDTH, ACTUAL_HEIGHT, OUTER_GRADIENT_TOP, OUTER_GRADIENT_BOTTOM
+        )
         
         logger.info("✨ Outer gradient background created (static surface)")
-        return outer_surf
+        return outer_surf.convert()
 
     def _render_flag_emojis(self) -> None:
         """Render flag emojis as sprites for countries without PNG sprites."""
@@ -729,21 +1100,33 @@ class GameEngine:
         else:  # Linux
             emoji_font_name = "Noto Color Emoji"
         
+        # Misma fuente y tamaño para todos los países → cargarla una sola vez
+        try:
+            emoji_font = pygame.font.SysFont(emoji_font_name, 40)
+        except Exception as e:
+            logger.warning(f"Could not load emoji font {emoji_font_name}: {e}")
+            emoji_font = None
+        
         for country, racer in self.physics_world.racers.items():
             # Skip if already has sprite
             if racer.sprite is not None:
                 continue
             
             # Try to render emoji
-            if country in emoji_map:
+            if emoji_font is not None and country in emoji_map:
                 try:
-                    font = pygame.font.SysFont(emoji_font_name, 40)
-                    surf = font.render(emoji_map[country], True, (255, 255, 255))
+                    surf = emoji_font.render(emoji_map[country], True, (255, 255, 255))
                     racer.sprite = surf
                     logger.info(f"🚩 Rendered emoji for {country}")
                 except Exception as e:
                     logger.warning(f"Could not render emoji {emoji_map[country]}: {e}")
     
+    def _convert_racer_sprites(self) -> None:
+        """Convert racer sprites to the display pixel format for fast blits."""
+        for racer in self.physics_world.racers.values():
+            if racer.sprite is not None:
+                racer.sprite = racer.sprite.convert_alpha()
+    
     def emit_explosion(
         self, 
         pos: tuple[float, float], 
@@ -764,6 +1147,10 @@ class GameEngine:
         """
         x, y = pos
         
+        # Colores fuera de la paleta se ajustan al más cercano (atlas acotado)
+        if color not in self._particle_palette:
+            color = self._snap_particle_color(color)
+        
         # Premium gift detection (expensive gifts get golden particles)
         is_premium = diamond_count > 100
         
@@ -773,41 +1160,75 @@ class GameEngine:
             count = int(count * 1.5)  # 50% more particles
             power *= 1.3  # 30% more explosive
         
-        for _ in range(count):
-            # Random direction (full 360 degrees)
-            angle = random.uniform(0, 2 * math.pi)
-            
-            # Base speed with power multiplier
-            base_speed = random.uniform(80, 200)
-            speed = base_speed * power
-            
-            # Velocity vector
-            vel = pymunk.Vec2d(
-                math.cos(angle) * speed,
-                math.sin(angle) * speed
-            )
-            
-            # Lifetime (premium gifts = longer lasting particles)
-            if is_premium:
-                max_lifetime = random.uniform(80, 120)  # 1.3-2.0 seconds
-                # 🎯 VARIEDAD EN TAMAÑO: rango más amplio para victoria
-                initial_radius = random.randint(4, 14)  # Era uniform(10, 20)
-            else:
-                max_lifetime = random.uniform(40, 70)  # 0.66-1.16 seconds
-                # 🎯 VARIEDAD EN TAMAÑO: partículas normales con más variación
-                initial_radius = random.randint(4, 10)  # Era uniform(6, 12)
-            
-            particle = Particle(
-                pos=pymunk.Vec2d(x, y),
-                vel=vel,
+        particles = self.particles
+        pool = self._particle_pool
+        
+        # Pool lleno: no crecer por encima del límite durante ráfagas de regalos
+        count = min(count, self.MAX_PARTICLES - len(particles))
+        
+        # Parámetros aleatorios por lote: rangos resueltos una vez, un solo random() por valor
+        rand = random.random
+        getrandbits = random.getrandbits
+        speed_min = 80 * power
+        speed_span = 120 * power
+        if is_premium:
+            lifetime_min, lifetime_span = 80, 40  # 1.3-2.0 seconds
+            # 🎯 VARIEDAD EN TAMAÑO: rango más amplio para victoria (4-14)
+            radius_span = 11
+        else:
+            lifetime_min, lifetime_span = 40, 30  # 0.66-1.16 seconds
+            # 🎯 VARIEDAD EN TAMAÑO: partículas normales con más variación (4-10)
+            radius_span = 7
+        
+        # Lote 1: rellenar partículas del pool (un slice, sin comprobar el pool por partícula)
+        reused = min(count, len(pool))
+        if reused:
+            batch = pool[-reused:]
+            del pool[-reused:]
+            for particle in batch:
+                # Random direction (full 360 degrees) + base speed (80-200) with power multiplier
+                cos_a, sin_a = _DIR_LUT[getrandbits(10)]  # 10 bits → 0..1023 (_SIN_LUT_SIZE)
+                speed = speed_min + speed_span * rand()
+                # Lifetime (premium gifts = longer lasting particles)
+                max_lifetime = lifetime_min + lifetime_span * rand()
+                initial_radius = 4 + int(radius_span * rand())
+                
+                particle.x = x
+                particle.y = y
+                particle.vx = cos_a * speed
+                particle.vy = sin_a * speed
+                particle.color = color
+                particle.radius = initial_radius
+                particle.initial_radius = initial_radius
+                particle.lifetime = max_lifetime
+                particle.max_lifetime = max_lifetime
+            particles.extend(batch)
+        
+        # Lote 2: crear sólo las que el pool no pudo cubrir
+        for _ in range(count - reused):
+            cos_a, sin_a = _DIR_LUT[getrandbits(10)]
+            speed = speed_min + speed_span * rand()
+            max_lifetime = lifetime_min + lifetime_span * rand()
+            initial_radius = 4 + int(radius_span * rand())
+            particles.append(Particle(
+                x=x,
+                y=y,
+                vx=cos_a * speed,
+                vy=sin_a * speed,
                 color=color,
                 radius=initial_radius,
                 initial_radius=initial_radius,
                 lifetime=max_lifetime,
                 max_lifetime=max_lifetime
-            )
-            
-            self.particles.append(particle)
+            ))
+    
+    def _snap_particle_color(self, color: tuple[int, int, int]) -> tuple[int, int, int]:
+        """Return the palette color closest to `color` (squared RGB distance)."""
+        r, g, b = color[:3]
+        return min(
+            self._particle_palette,
+            key=lambda c: (c[0] - r) ** 2 + (c[1] - g) ** 2 + (c[2] - b) ** 2
+        )
     
     def emit_collision_particles(
         self, 
@@ -841,123 +1262,198 @@ class GameEngine:
     def update_particles(self, dt: float) -> None:
         """
         Update all particles: physics, lifetime, and cleanup.
-        Optimized for performance with list comprehension.
+        Scalar float math only: no Vec2d temporaries per particle per frame.
+        Dead particles are swap-removed in place and returned to the pool.
         """
-        particles_to_keep = []
+        particles = self.particles
+        pool = self._particle_pool
+        gravity_dt = 400 * dt  # Gravity acceleration (px/s²) × dt
+        frames_dt = 60 * dt    # Convert dt to frames (60fps)
         
-        for particle in self.particles:
-            # Physics update using Pymunk vectors
-            particle.pos += particle.vel * dt
+        i = 0
+        while i < len(particles):
+            particle = particles[i]
             
-            # Apply gravity to velocity
-            particle.vel += pymunk.Vec2d(0, 400) * dt  # Gravity acceleration
+            # Physics update (posición con la velocidad previa, luego gravedad)
+            vy = particle.vy
+            particle.x += particle.vx * dt
+            particle.y += vy * dt
+            particle.vy = vy + gravity_dt
             
             # Reduce lifetime (frame-based)
-            particle.lifetime -= 60 * dt  # Convert dt to frames (60fps)
+            lifetime = particle.lifetime - frames_dt
+            particle.lifetime = lifetime
             
             # Proportional radius reduction based on lifetime
-            life_ratio = particle.lifetime / particle.max_lifetime if particle.max_lifetime > 0 else 0
+            max_lifetime = particle.max_lifetime
+            life_ratio = lifetime / max_lifetime if max_lifetime > 0 else 0
             particle.radius = particle.initial_radius * life_ratio
             
             # Keep particle if still alive
-            if particle.lifetime > 0:
-                particles_to_keep.append(particle)
-        
-        # Efficient cleanup
-        self.particles = particles_to_keep
+            if lifetime > 0:
+                i += 1
+                continue
+            
+            # Swap-remove: la última ocupa este hueco (se procesa en la siguiente vuelta)
+            last = particles.pop()
+            if last is not particle:
+                particles[i] = last
+            pool.append(particle)
     
     def update_floating_texts(self) -> None:
         """Update and remove floating texts."""
-        texts_to_keep = []
-        
-        for text in self.floating_texts:
-            text.update()
-            
-            # Keep alive texts
-            if text.is_alive:
-                texts_to_keep.append(text)
-        
-        # Cleanup
-        self.floating_texts = texts_to_keep
+        # Un solo recorrido in-place: cada texto sale por la izquierda y, si sigue
+        # vivo, vuelve a entrar por la derecha (mismo orden, sin lista nueva)
+        floating_texts = self.floating_texts
+        
+        for _ in range(len(floating_texts)):
+            text = floating_texts.popleft()
+            text.y += text.dy
+            text.lifespan -= 1
+            
+            # Keep alive texts (los retirados vuelven al pool)
+            if text.lifespan > 0:
+                floating_texts.append(text)
+            else:
+                self._floating_text_pool.append(text)
     
     def _render_trails(self) -> None:
         """
         Render trail particles behind flags.
         Creates smooth color trails showing flag movement.
+        Sprites come from the same cached circle atlas as the explosion particles
+        and every trail is submitted in a single Surface.blits() call.
         """
+        batch = []
         for country, trail_particles in self.particle_manager.trail_particles.items():
             for particle in trail_particles:
                 if particle.alpha <= 0 or particle.size <= 0:
                     continue
                 
-                # Create surface for trail particle with alpha
-                size = max(int(particle.size * 2), 2)
-                trail_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+                radius = max(int(particle.size), 1)
                 
-                # Draw particle with alpha
-                color_with_alpha = (*particle.color, particle.alpha)
-                pygame.draw.circle(
-                    trail_surf,
-                    color_with_alpha,
-                    (size // 2, size // 2),
-                    max(int(particle.size), 1)
-                )
+                # Cuantizar alpha a 16 niveles para reutilizar sprites del atlas
+                trail_surf = self._get_particle_sprite(particle.color, radius, (particle.alpha >> 4) << 4 | 15)
                 
-                # Blit to render surface
-                blit_x = int(particle.pos[0] - size // 2)
-                blit_y = int(particle.pos[1] - size // 2)
-                self.render_surface.blit(trail_surf, (blit_x, blit_y))
+                blit_x = int(particle.pos[0] - radius)
+                blit_y = int(particle.pos[1] - radius)
+                batch.append((trail_surf, (blit_x, blit_y)))
+        
+        if batch:
+            self.render_surface.blits(batch, doreturn=False)
+    
+    def _get_particle_sprite(self, color: tuple, radius: int, alpha: int) -> pygame.Surface:
+        """
+        Devuelve (y cachea) el sprite circular para una partícula.
+        El alpha llega ya cuantizado, así que el atlas se mantiene pequeño.
+        """
+        key = (color, radius, alpha)
+        sprite = self._particle_sprites.get(key)
+        if sprite is None:
+            # Safety: con la paleta cerrada no debería llenarse nunca
+            if len(self._particle_sprites) > 4096:
+                self._particle_sprites.clear()
+            size = radius * 2
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, alpha), (radius, radius), radius)
+            sprite = sprite.convert_alpha()
+            self._particle_sprites[key] = sprite
+        return sprite
     
     def _render_particles(self) -> None:
         """
-        Render particles with optimized direct circle drawing.
-        Uses pygame.draw.circle directly on surface for maximum speed.
+        Render particles from a cached sprite atlas.
+        All visible particles are submitted in a single Surface.blits() call.
         """
+        batch = []
+        # Referencias locales: LOAD_FAST en el bucle en vez de búsquedas de atributo
+        append = batch.append
+        get_sprite = self._get_particle_sprite
+        safe_int = self._safe_int
+        isfinite = math.isfinite
+        
         for particle in self.particles:
+            x = particle.x
+            y = particle.y
+            
             # Skip if position is invalid
-            if not math.isfinite(particle.pos.x) or not math.isfinite(particle.pos.y):
+            if not isfinite(x) or not isfinite(y):
                 continue
             
             # Calculate lifetime ratio for opacity
-            life_ratio = particle.lifetime / particle.max_lifetime if particle.max_lifetime > 0 else 0
+            max_lifetime = particle.max_lifetime
+            life_ratio = particle.lifetime / max_lifetime if max_lifetime > 0 else 0
             
             # Opacity fade
-            opacity = self._safe_int(255 * life_ratio, 0)
-            
-            # Clamp radius to minimum 1 pixel
-            radius = max(self._safe_int(particle.radius, 1), 1)
+            opacity = safe_int(255 * life_ratio, 0)
             
             # Skip if too transparent
             if opacity < 10:
                 continue
             
-            # Create color with alpha
-            color_with_alpha = (*particle.color, opacity)
+            # Clamp radius to minimum 1 pixel
+            radius = max(safe_int(particle.radius, 1), 1)
+            
+            # Culling: las partículas que ya salieron de pantalla (caen por gravedad)
+            # no generan sprite ni entrada en el batch
+            if (
+                x + radius < 0
+                or x - radius >= SCREEN_WIDTH
+                or y + radius < 0
+                or y - radius >= SCREEN_HEIGHT
+            ):
+                continue
             
-            # Optimized: Direct circle draw with alpha
-            # Create minimal surface for particle
-            size = radius * 2
-            particle_surf = pygame.Surface((size, size), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surf, color_with_alpha, (radius, radius), radius)
+            # Cuantizar alpha a 16 niveles para reutilizar sprites del atlas
+            sprite = get_sprite(particle.color, radius, (opacity >> 4) << 4 | 15)
             
-            # Blit to render surface (safe conversions)
-            blit_x = self._safe_int(particle.pos.x - radius, 0)
-            blit_y = self._safe_int(particle.pos.y - radius, 0)
-            self.render_surface.blit(particle_surf, (blit_x, blit_y))
+            # Safe conversions
+            append((sprite, (safe_int(x - radius, 0), safe_int(y - radius, 0))))
+        
+        if batch:
+            self.render_surface.blits(batch, doreturn=False)
     
     def _render_floating_texts(self) -> None:
         """Render all floating texts for visual feedback."""
+        # ⚡ Un único blits() para todos los textos (outline + texto principal)
+        batch = []
         for text in self.floating_texts:
-            text.draw(self.render_surface)
+            batch.extend(text.get_blit_items())
+        
+        if batch:
+            self.render_surface.blits(batch, doreturn=False)
     
     async def process_events(self) -> None:
-        """Process all available events from the queue."""
-        while True:
+        """
+        Process the events available in the queue.
+        qsize() is exact for this single consumer, so the batch is sized up front
+        (no QueueEmpty per frame); bursts beyond MAX_EVENTS_PER_FRAME wait for the next frame.
+        """
+        pending = min(self.queue.qsize(), self.MAX_EVENTS_PER_FRAME)
+        get_nowait = self.queue.get_nowait
+        for _ in range(pending):
+            await self._handle_event(get_nowait())
+    
+    async def wait_events(self, timeout: float) -> None:
+        """
+        Wait up to `timeout` seconds between frames, handling events as soon as they arrive.
+        Replaces a plain asyncio.sleep(): the frame pacing is the same, but the queue is
+        drained while waiting instead of sitting idle until the next frame.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        
+        while self.running:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
             try:
-                event = self.queue.get_nowait()
-                await self._handle_event(event)
-            except asyncio.QueueEmpty:
+                event = await asyncio.wait_for(self.queue.get(), remaining)
+            except asyncio.TimeoutError:
                 break
+            await self._handle_event(event)
+            # Lo que haya llegado junto a este evento se procesa en bloque
+            await self.process_events()
     
     async def _handle_event(self, event: GameEvent) -> None:
         """Handle a single event from the queue."""
@@ -971,9 +1467,7 @@ class GameEngine:
                 self.connection_state = event.extra["state"]
             
             message = event.format_message()
-            self.messages.append((message, event.type))
-            if len(self.messages) > MAX_MESSAGES:
-                self.messages = self.messages[-MAX_MESSAGES:]
+            self._add_message(message, event.type)
         
         elif event.type == EventType.GIFT:
             # TRANSICIÓN: IDLE -> RACING al primer regalo
@@ -1036,19 +1530,15 @@ class GameEngine:
                 )
                 
                 # Emit floating text feedback (respect global limit)
-                self.floating_texts.append(
-                    FloatingText(
-                        text=f"{gift_name} x{gift_count}",
-                        x=pos[0],
-                        y=pos[1] - 30,
-                        color=(255, 255, 255),
-                        lifespan=40,
-                        max_lifespan=40,
-                        font_size=20
-                    )
+                self._add_floating_text(
+                    text=f"{gift_name} x{gift_count}",
+                    x=pos[0],
+                    y=pos[1] - 30,
+                    color=(255, 255, 255),
+                    lifespan=40,
+                    max_lifespan=40,
+                    font_size=20
                 )
-                if len(self.floating_texts) > self.MAX_FLOATING_TEXTS:
-                    self.floating_texts = self.floating_texts[-self.MAX_FLOATING_TEXTS:]
             
             # Apply combat effects (Rosa, Pesa, Helado)
             combat_result = self.physics_world.apply_gift_effect(
@@ -1092,7 +1582,8 @@ class GameEngine:
                     self.screen_shaker.impact_shake()
             
             if self.database:
-                await self.database.save_event_to_db(
+                # Encolado: el writer de la base de datos inserta por lotes en segundo plano
+                self.database.queue_event(
                     user=username,
                     gift_name=gift_name,
                     diamond_count=diamond_count,
@@ -1108,9 +1599,7 @@ class GameEngine:
             }.get(assignment_type, "")
             
             message = f"{assignment_indicator} {username} → {country}: {gift_name} x{gift_count} ({diamond_count}💎)"
-            self.messages.append((message, event.type))
-            if len(self.messages) > MAX_MESSAGES:
-                self.messages = self.messages[-MAX_MESSAGES:]
+            self._add_message(message, event.type)
     
         elif event.type == EventType.JOIN:
             await self._handle_join_event(event)
@@ -1127,9 +1616,7 @@ class GameEngine:
             
             # Display comment in message log
             message = event.format_message()
-            self.messages.append((message, event.type))
-            if len(self.messages) > MAX_MESSAGES:
-                self.messages = self.messages[-MAX_MESSAGES:]
+            self._add_message(message, event.type)
     
     async def _handle_join_event(self, event: GameEvent) -> None:
         """Handle user joining a team via keyword."""
@@ -1147,13 +1634,11 @@ class GameEngine:
                 # User wants to switch teams
                 logger.info(f"🔄 {username} switching from {current_country} to {requested_country}")
         
-        # Anti-spam check
-        import time
-        current_time = time.time()
-        last_time = self.last_join_time.get(username, 0)
+        # Anti-spam check (reloj monotónico en ns enteros: inmune a saltos del reloj de pared)
+        current_time_ns = time.monotonic_ns()
+        last_time_ns = self.last_join_time_ns.get(username)
         
-        from .config import JOIN_NOTIFICATION_COOLDOWN
-        if current_time - last_time < JOIN_NOTIFICATION_COOLDOWN:
+        if last_time_ns is not None and current_time_ns - last_time_ns < _JOIN_NOTIFICATION_COOLDOWN_NS:
             return  # Too soon, ignore
         
         # Check if country exists in race
@@ -1163,11 +1648,10 @@ class GameEngine:
         
         # Assign user to team
         self.user_assignments[username] = requested_country
-        self.last_join_time[username] = current_time
+        self.last_join_time_ns[username] = current_time_ns
         
         # Visual feedback: floating text on the country's lane
-        racer = self.physics_world.racers[requested_country]
-        lane_y = self.physics_world.game_area_top + (racer.lane * self.physics_world.lane_height) + (self.physics_world.lane_height // 2)
+        lane_y = self._lane_y[requested_country]
         
         self.spawn_floating_text(
             f"@{username} joined!",
@@ -1186,9 +1670,6 @@ class GameEngine:
         Args:
             event: Vote event with country as content
         """
-        from .config import COMMENT_POINTS_PER_MESSAGE, COMMENT_COOLDOWN
-        import time
-        
         # TRANSICIÓN: IDLE -> RACING al primer voto
         if self.game_state == 'IDLE':
             self._transition_to_racing()
@@ -1247,24 +1728,20 @@ class GameEngine:
             
             # Optional: floating text feedback (limited)
             if len(self.floating_texts) < self.MAX_FLOATING_TEXTS // 2:
-                self.floating_texts.append(
-                    FloatingText(
-                        text=f"+{COMMENT_POINTS_PER_MESSAGE}",
-                        x=pos[0],
-                        y=pos[1] - 20,
-                        color=(0, 200, 255),  # Neon blue for votes
-                        lifespan=30,
-                        max_lifespan=30,
-                        font_size=14,
-                        dy=-2.5  # Faster jump
-                    )
+                self._add_floating_text(
+                    text=f"+{COMMENT_POINTS_PER_MESSAGE}",
+                    x=pos[0],
+                    y=pos[1] - 20,
+                    color=(0, 200, 255),  # Neon blue for votes
+                    lifespan=30,
+                    max_lifespan=30,
+                    font_size=14,
+                    dy=-2.5  # Faster jump
                 )
         
         # Add message to feed
         message = event.format_message()
-        self.messages.append((message, event.type))
-        if len(self.messages) > MAX_MESSAGES:
-            self.messages = self.messages[-MAX_MESSAGES:]
+        self._add_message(message, event.type)
     
     def handle_pygame_events(self) -> None:
         """Process Pygame input events."""
@@ -1278,6 +1755,9 @@ class GameEngine:
             if event.type == pygame.QUIT:
                 logger.info("🚪 Exiting: window closed (pygame.QUIT)")
                 self.running = False
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                # La ventana se volvió a mostrar: repintar también el margen exterior
+                self._outer_background_dirty = True
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     now = time.time()
@@ -1292,278 +1772,221 @@ class GameEngine:
                         self._esc_quit_requested = True
                         self._esc_quit_time = now
                         logger.info("🚪 Press ESC again within 2s to quit")
-                elif event.key == pygame.K_c or event.key == pygame.K_r:
-                    self._return_to_idle()  # Usar nuevo método
-                    logger.info("Race reset to IDLE!")
-                elif event.key == pygame.K_t:  # Test mode
-                    # CAMBIAR A RACING SI ESTÁ EN IDLE
-                    if self.game_state == 'IDLE':
-                        self._transition_to_racing()
-                        logger.info("🏁 Game state: RACING (test mode)")
-    
-                    countries = list(self.physics_world.racers.keys())
-                    country = random.choice(countries)
-                    diamonds = random.randint(1, 10)
-                    
-                    self.physics_world.apply_gift_impulse(
-                        country=country,
-                        gift_name="Test Gift",
-                        diamond_count=diamonds
-                    )
-                    
-                    logger.info(f"TEST: {country} received {diamonds}💎")
-                    
-                elif event.key == pygame.K_y:  # Y = Test Big Gift
-                    # CAMBIAR A RACING SI ESTÁ EN IDLE
-                    if self.game_state == 'IDLE':
-                        self._transition_to_racing()
-                        logger.info("🏁 Game state: RACING (test mode)")
-    
-                    countries = list(self.physics_world.racers.keys())
-                    country = random.choice(countries)
-                    diamonds = random.randint(25, 50)
-                    
-                    self.physics_world.apply_gift_impulse(
-                        country=country,
-                        gift_name="Big Test Gift",
-                        diamond_count=diamonds
-                    )
-                    
-                    logger.info(f"TEST BIG: {country} received {diamonds}💎")
+                else:
+                    # Teclas de control/test: tabla de despacho construida una sola vez en __init__
+                    handler = self._key_handlers.get(event.key)
+                    if handler:
+                        handler()
 
-                elif event.key == pygame.K_1:  # 1 = Test Vote/Rosa (depends on mode)
-                    from .config import GAME_MODE
-                    
-                    # CAMBIAR A RACING SI ESTÁ EN IDLE
-                    if self.game_state == 'IDLE':
-                        self._transition_to_racing()
-                        logger.info("🏁 Game state: RACING (test mode)")
+    def _reset_to_idle_key(self) -> None:
+        """C/R: reset race to IDLE."""
+        self._return_to_idle()  # Usar nuevo método
+        logger.info("Race reset to IDLE!")
     
-                    countries = list(self.physics_world.racers.keys())
-                    country = random.choice(countries)
-                    
-                    if GAME_MODE == "COMMENT":
-                        # Test vote for country
-                        test_username = f"TestVoter{int(time.time() * 1000) % 1000}"
-                        
-                        vote_event = GameEvent(
-                            type=EventType.VOTE,
-                            username=test_username,
-                            content=country,
-                            extra={"shortcut": "1"}
-                        )
-                        
-                        try:
-                            self.queue.put_nowait(vote_event)
-                            logger.info(f"TEST VOTE: {test_username} → {country}")
-                        except Exception as e:
-                            logger.error(f"Error adding test vote: {e}")
-                    else:
-                        # Test Rosa effect (GIFT mode)
-                        result = self.physics_world.apply_gift_effect("Rosa", country)
-                        logger.info(f"TEST ROSA: {country}")
-                        
-                        # Spawn floating text
-                        if result['effect'] == 'advance':
-                            racer = self.physics_world.racers[country]
-                            self.spawn_floating_text(
-                                "+5m", 
-                                racer.body.position.x, 
-                                racer.body.position.y,
-                                COLOR_TEXT_POSITIVE
-                            )
-
-                elif event.key == pygame.K_2:  # 2 = Test Vote/Pesa (depends on mode)
-                    from .config import GAME_MODE
-                    
-                    # CAMBIAR A RACING SI ESTÁ EN IDLE
-                    if self.game_state == 'IDLE':
-                        self._transition_to_racing()
-                        logger.info("🏁 Game state: RACING (test mode)")
+    def _ensure_racing_for_test(self, reason: str = "test mode", icon: str = "🏁") -> None:
+        """CAMBIAR A RACING SI ESTÁ EN IDLE (shared by every test hotkey)."""
+        if self.game_state == 'IDLE':
+            self._transition_to_racing()
+            logger.info(f"{icon} Game state: RACING ({reason})")
     
-                    countries = list(self.physics_world.racers.keys())
-                    country = random.choice(countries)
-                    
-                    if GAME_MODE == "COMMENT":
-                        # Test vote for country
-                        test_username = f"TestVoter{int(time.time() * 1000) % 1000}"
-                        
-                        vote_event = GameEvent(
-                            type=EventType.VOTE,
-                            username=test_username,
-                            content=country,
-                            extra={"shortcut": "2"}
-                        )
-                        
-                        try:
-                            self.queue.put_nowait(vote_event)
-                            logger.info(f"TEST VOTE: {test_username} → {country}")
-                        except Exception as e:
-                            logger.error(f"Error adding test vote: {e}")
-                    else:
-                        # Test Pesa effect (GIFT mode)
-                        result = self.physics_world.apply_gift_effect("Pesa", country)
-                        logger.info(f"TEST PESA: attacking leader")
-                        
-                        # Spawn floating text on the affected target (leader)
-                        if result['effect'] == 'setback':
-                            target = result['target']
-                            if target in self.physics_world.racers:
-                                racer = self.physics_world.racers[target]
-                                self.spawn_floating_text(
-                                    "-10m", 
-                                    racer.body.position.x, 
-                                    racer.body.position.y,
-                                    COLOR_TEXT_NEGATIVE
-                                )
-                    
-                elif event.key == pygame.K_3:  # 3 = Test Vote/Helado (depends on mode)
-                    from .config import GAME_MODE
-                    
-                    # CAMBIAR A RACING SI ESTÁ EN IDLE
-                    if self.game_state == 'IDLE':
-                        self._transition_to_racing()
-                        logger.info("🏁 Game state: RACING (test mode)")
+    def _test_gift(self, gift_name: str, min_diamonds: int, max_diamonds: int, label: str) -> None:
+        """T/Y: random gift impulse to a random country."""
+        self._ensure_racing_for_test()
+        
+        country = random.choice(self._racer_countries)
+        diamonds = random.randint(min_diamonds, max_diamonds)
+        
+        self.physics_world.apply_gift_impulse(
+            country=country,
+            gift_name=gift_name,
+            diamond_count=diamonds
+        )
+        
+        logger.info(f"{label}: {country} received {diamonds}💎")
     
-                    countries = list(self.physics_world.racers.keys())
-                    country = random.choice(countries)
-                    
-                    if GAME_MODE == "COMMENT":
-                        # Test vote for country
-                        test_username = f"TestVoter{int(time.time() * 1000) % 1000}"
-                        
-                        vote_event = GameEvent(
-                            type=EventType.VOTE,
-                            username=test_username,
-                            content=country,
-                            extra={"shortcut": "3"}
-                        )
-                        
-                        try:
-                            self.queue.put_nowait(vote_event)
-                            logger.info(f"TEST VOTE: {test_username} → {country}")
-                        except Exception as e:
-                            logger.error(f"Error adding test vote: {e}")
-                    else:
-                        # Test Helado effect (GIFT mode)
-                        result = self.physics_world.apply_gift_effect("Helado", country)
-                        logger.info(f"TEST HELADO: freezing leader")
-                        
-                        # Spawn floating text on the frozen target
-                        if result['effect'] == 'freeze':
-                            target = result['target']
-                            if target in self.physics_world.racers:
-                                racer = self.physics_world.racers[target]
-                                self.spawn_floating_text(
-                                    "FREEZE!", 
-                                    racer.body.position.x, 
-                                    racer.body.position.y,
-                                    COLOR_TEXT_FREEZE
-                                )
-    
-                elif event.key == pygame.K_j:  # J = Test JoinEvent
-                    # Generate random test join
-                    # Random username with timestamp to make it unique
-                    test_usernames = [
-                        "TestUser", "Viewer", "Fan", "Supporter", "Player", 
-                        "Streamer", "Watcher", "Usuario", "Espectador"
-                    ]
-                    base_username = random.choice(test_usernames)
-                    unique_username = f"{base_username}{int(time.time() * 1000) % 1000}"
-                    
-                    # Random country
-                    countries = list(self.physics_world.racers.keys())
-                    random_country = random.choice(countries)
-                    
-                    # Random keyword that would trigger this country
-                    from .config import COUNTRY_KEYWORDS
-                    # Find a keyword for this country
-                    matching_keywords = [k for k, v in COUNTRY_KEYWORDS.items() if v == random_country]
-                    keyword_used = random.choice(matching_keywords) if matching_keywords else random_country.lower()
-                    
-                    # Create fake JoinEvent and put it in queue
-                    join_event = GameEvent(
-                        type=EventType.JOIN,
-                        username=unique_username,
-                        content=random_country,
-                        extra={
-                            "keyword": keyword_used,
-                            "original_message": f"¡Vamos {keyword_used}!"
-                        }
-                    )
-                    
-                    # Add to queue for processing
-                    try:
-                        self.queue.put_nowait(join_event)
-                        logger.info(f"TEST JOIN: {unique_username} → {random_country} (keyword: {keyword_used})")
-                    except Exception as e:
-                        logger.error(f"Error adding test join to queue: {e}")
-
-                elif event.key == pygame.K_k:  # K = Toggle stress test (VOTE/GIFT @ 20/sec)
-                    self._stress_test_active = not self._stress_test_active
-                    if self._stress_test_active:
-                        self._stress_test_last_inject = time.time()
-                        if self.game_state == 'IDLE':
-                            self._transition_to_racing()
-                            logger.info("🏁 Game state: RACING (stress test)")
-                        logger.info("🧪 STRESS TEST ACTIVE – VOTE/GIFT @ 20/s. Press K again to stop.")
-                    else:
-                        logger.info("🧪 STRESS TEST OFF")
-                
-                elif event.key == pygame.K_f:  # F = Test FIRE (rapid combo)
-                    # Cooldown to avoid crash when spamming F (TTS/audio flood)
-                    now = time.time()
-                    if now - self._last_test_fire_time >= self._test_fire_cooldown:
-                        self._last_test_fire_time = now
-                        # CAMBIAR A RACING SI ESTÁ EN IDLE
-                        if self.game_state == 'IDLE':
-                            self._transition_to_racing()
-                            logger.info("🏁 Game state: RACING (test mode)")
-                        try:
-                            self._test_fire_active = True
-                            countries = list(self.physics_world.racers.keys())
-                            test_country = random.choice(countries)
-                            for _ in range(12):
-                                self.register_combo_event(test_country)
-                                self.physics_world.apply_gift_impulse(
-                                    country=test_country,
-                                    gift_name="ComboTest",
-                                    diamond_count=1
-                                )
-                            logger.info(f"🔥 TEST FIRE: {test_country} - triggered ON FIRE state!")
-                        except Exception as e:
-                            logger.exception("🔥 TEST FIRE failed: %s", e)
-                        finally:
-                            self._test_fire_active = False
-                    else:
-                        logger.debug("🔥 TEST FIRE: cooldown %.1fs", self._test_fire_cooldown - (now - self._last_test_fire_time))
-                
-                elif event.key == pygame.K_g:  # G = Test Final Stretch
-                    # CAMBIAR A RACING SI ESTÁ EN IDLE
-                    if self.game_state == 'IDLE':
-                        self._transition_to_racing()
-                        logger.info("🏁 Game state: RACING (test mode)")
-                    
-                    # Force trigger final stretch
-                    if not self.final_stretch_triggered:
-                        self._trigger_final_stretch()
-                        logger.info("🏁 TEST: Final Stretch triggered!")
-                
-                elif event.key == pygame.K_v:  # V = Test Victory Sequence
-                    # CAMBIAR A RACING SI ESTÁ EN IDLE
-                    if self.game_state == 'IDLE':
-                        self._transition_to_racing()
-                        logger.info("🏆 Game state: RACING (test mode)")
-                    
-                    # Force trigger victory
-                    test_countries = list(self.physics_world.racers.keys())
-                    if test_countries:
-                        winner = random.choice(test_countries)
-                        self.physics_world.winner = winner
-                        self.physics_world.race_finished = True
-                        captain = self.current_captains.get(winner, "TestKing")
-                        self._trigger_victory_sequence(winner, captain)
-                        logger.info(f"🏆 TEST VICTORY: {winner} wins! Captain: {captain}")
+    def _test_vote(self, country: str, shortcut: str) -> None:
+        """Queue a fake vote for `country` (COMMENT mode test hotkeys)."""
+        test_username = f"TestVoter{int(time.time() * 1000) % 1000}"
+        
+        vote_event = GameEvent(
+            type=EventType.VOTE,
+            username=test_username,
+            content=country,
+            extra={"shortcut": shortcut}
+        )
+        
+        try:
+            self.queue.put_nowait(vote_event)
+            logger.info(f"TEST VOTE: {test_username} → {country}")
+        except Exception as e:
+            logger.error(f"Error adding test vote: {e}")
+    
+    def _test_key_1(self) -> None:
+        """1 = Test Vote/Rosa (depends on mode)."""
+        self._ensure_racing_for_test()
+        country = random.choice(self._racer_countries)
+        
+        if GAME_MODE == "COMMENT":
+            self._test_vote(country, "1")
+            return
+        
+        # Test Rosa effect (GIFT mode)
+        result = self.physics_world.apply_gift_effect("Rosa", country)
+        logger.info(f"TEST ROSA: {country}")
+        
+        # Spawn floating text
+        if result['effect'] == 'advance':
+            racer = self.physics_world.racers[country]
+            self.spawn_floating_text(
+                "+5m", 
+                racer.body.position.x, 
+                racer.body.position.y,
+                COLOR_TEXT_POSITIVE
+            )
+    
+    def _test_key_2(self) -> None:
+        """2 = Test Vote/Pesa (depends on mode)."""
+        self._ensure_racing_for_test()
+        country = random.choice(self._racer_countries)
+        
+        if GAME_MODE == "COMMENT":
+            self._test_vote(country, "2")
+            return
+        
+        # Test Pesa effect (GIFT mode)
+        result = self.physics_world.apply_gift_effect("Pesa", country)
+        logger.info(f"TEST PESA: attacking leader")
+        
+        # Spawn floating text on the affected target (leader)
+        if result['effect'] == 'setback':
+            target = result['target']
+            if target in self.physics_world.racers:
+                racer = self.physics_world.racers[target]
+                self.spawn_floating_text(
+                    "-10m", 
+                    racer.body.position.x, 
+                    racer.body.position.y,
+                    COLOR_TEXT_NEGATIVE
+                )
+    
+    def _test_key_3(self) -> None:
+        """3 = Test Vote/Helado (depends on mode)."""
+        self._ensure_racing_for_test()
+        country = random.choice(self._racer_countries)
+        
+        if GAME_MODE == "COMMENT":
+            self._test_vote(country, "3")
+            return
+        
+        # Test Helado effect (GIFT mode)
+        result = self.physics_world.apply_gift_effect("Helado", country)
+        logger.info(f"TEST HELADO: freezing leader")
+        
+        # Spawn floating text on the frozen target
+        if result['effect'] == 'freeze':
+            target = result['target']
+            if target in self.physics_world.racers:
+                racer = self.physics_world.racers[target]
+                self.spawn_floating_text(
+                    "FREEZE!", 
+                    racer.body.position.x, 
+                    racer.body.position.y,
+                    COLOR_TEXT_FREEZE
+                )
+    
+    def _test_join(self) -> None:
+        """J = Test JoinEvent."""
+        # Generate random test join
+        # Random username with timestamp to make it unique
+        test_usernames = [
+            "TestUser", "Viewer", "Fan", "Supporter", "Player", 
+            "Streamer", "Watcher", "Usuario", "Espectador"
+        ]
+        base_username = random.choice(test_usernames)
+        unique_username = f"{base_username}{int(time.time() * 1000) % 1000}"
+        
+        # Random country
+        random_country = random.choice(self._racer_countries)
+        
+        # Random keyword that would trigger this country
+        matching_keywords = COUNTRY_TO_KEYWORDS.get(random_country, [])
+        keyword_used = random.choice(matching_keywords) if matching_keywords else random_country.lower()
+        
+        # Create fake JoinEvent and put it in queue
+        join_event = GameEvent(
+            type=EventType.JOIN,
+            username=unique_username,
+            content=random_country,
+            extra={
+                "keyword": keyword_used,
+                "original_message": f"¡Vamos {keyword_used}!"
+            }
+        )
+        
+        # Add to queue for processing
+        try:
+            self.queue.put_nowait(join_event)
+            logger.info(f"TEST JOIN: {unique_username} → {random_country} (keyword: {keyword_used})")
+        except Exception as e:
+            logger.error(f"Error adding test join to queue: {e}")
+    
+    def _toggle_stress_test(self) -> None:
+        """K = Toggle stress test (VOTE/GIFT @ 20/sec)."""
+        self._stress_test_active = not self._stress_test_active
+        if self._stress_test_active:
+            self._stress_test_last_inject = time.time()
+            self._ensure_racing_for_test("stress test")
+            logger.info("🧪 STRESS TEST ACTIVE – VOTE/GIFT @ 20/s. Press K again to stop.")
+        else:
+            logger.info("🧪 STRESS TEST OFF")
+    
+    def _test_fire(self) -> None:
+        """F = Test FIRE (rapid combo)."""
+        # Cooldown to avoid crash when spamming F (TTS/audio flood)
+        now = time.time()
+        if now - self._last_test_fire_time < self._test_fire_cooldown:
+            logger.debug("🔥 TEST FIRE: cooldown %.1fs", self._test_fire_cooldown - (now - self._last_test_fire_time))
+            return
+        
+        self._last_test_fire_time = now
+        self._ensure_racing_for_test()
+        try:
+            self._test_fire_active = True
+            test_country = random.choice(self._racer_countries)
+            for _ in range(12):
+                self.register_combo_event(test_country)
+                self.physics_world.apply_gift_impulse(
+                    country=test_country,
+                    gift_name="ComboTest",
+                    diamond_count=1
+                )
+            logger.info(f"🔥 TEST FIRE: {test_country} - triggered ON FIRE state!")
+        except Exception as e:
+            logger.exception("🔥 TEST FIRE failed: %s", e)
+        finally:
+            self._test_fire_active = False
+    
+    def _test_final_stretch(self) -> None:
+        """G = Test Final Stretch."""
+        self._ensure_racing_for_test()
+        
+        # Force trigger final stretch
+        if not self.final_stretch_triggered:
+            self._trigger_final_stretch()
+            logger.info("🏁 TEST: Final Stretch triggered!")
+    
+    def _test_victory(self) -> None:
+        """V = Test Victory Sequence."""
+        self._ensure_racing_for_test(icon="🏆")
+        
+        # Force trigger victory
+        if self._racer_countries:
+            winner = random.choice(self._racer_countries)
+            self.physics_world.winner = winner
+            self.physics_world.race_finished = True
+            captain = self.current_captains.get(winner, "TestKing")
+            self._trigger_victory_sequence(winner, captain)
+            logger.info(f"🏆 TEST VICTORY: {winner} wins! Captain: {captain}")
 
     def _update_captain_points(self, username: str, country: str, points: int) -> None:
         """
@@ -1575,14 +1998,32 @@ class GameEngine:
             points: Diamond count from the gift
         """
         # Initialize country tracking if needed
-        if country not in self.session_points:
-            self.session_points[country] = {}
+        country_points = self.session_points.get(country)
+        if country_points is None:
+            country_points = self.session_points[country] = {}
+        
+        best = self._country_best.get(country)
         
         # Add points to user's total
-        if username not in self.session_points[country]:
-            self.session_points[country][username] = 0
+        if username not in country_points:
+            # Mapa lleno: desalojar al de menos puntos (nunca al MVP) para acotar memoria
+            if len(country_points) >= self.MAX_TRACKED_USERS_PER_COUNTRY:
+                mvp = best[0] if best else None
+                evicted = min(
+                    (user for user in country_points if user != mvp),
+                    key=country_points.__getitem__,
+                    default=None
+                )
+                if evicted is not None:
+                    del country_points[evicted]
+            country_points[username] = 0
+        
+        country_points[username] += points
         
-        self.session_points[country][username] += points
+        # MVP incremental: sólo un '>' estricto desplaza al líder (el primero en llegar se queda)
+        new_total = country_points[username]
+        if best is None or new_total > best[1] or username == best[0]:
+            self._country_best[country] = (username, new_total)
         
         # Check for new captain
         old_captain = self.current_captains.get(country, "")
@@ -1604,22 +2045,8 @@ class GameEngine:
         Returns:
             Username of MVP, or empty string if no contributions
         """
-        if country not in self.session_points:
-            return ""
-        
-        country_points = self.session_points[country]
-        if not country_points:
-            return ""
-        
-        # Find max points
-        max_points = max(country_points.values())
-        
-        # Find first user to reach max points (maintains insertion order)
-        for username, points in country_points.items():
-            if points == max_points:
-                return username
-        
-        return ""
+        best = self._country_best.get(country)
+        return best[0] if best else ""
 
     def _announce_new_captain(self, country: str, new_captain: str, old_captain: str) -> None:
         """
@@ -1641,31 +2068,27 @@ class GameEngine:
         
         # 👑 GOLDEN CROWN floating text for new captain (larger, longer)
         crown_text = f"👑 {new_captain}"
-        self.floating_texts.append(
-            FloatingText(
-                text=crown_text,
-                x=x,
-                y=y - 15,
-                color=(255, 215, 0),  # Gold
-                lifespan=80,
-                max_lifespan=80,
-                font_size=18,  # Larger for emphasis
-                dy=-2.5  # Faster upward movement
-            )
+        self._add_floating_text(
+            text=crown_text,
+            x=x,
+            y=y - 15,
+            color=(255, 215, 0),  # Gold
+            lifespan=80,
+            max_lifespan=80,
+            font_size=18,  # Larger for emphasis
+            dy=-2.5  # Faster upward movement
         )
         
         # Secondary "NEW CAPTAIN" text with neon effect
-        self.floating_texts.append(
-            FloatingText(
-                text="NEW CAPTAIN!",
-                x=x,
-                y=y - 35,
-                color=(255, 255, 100),  # Bright yellow
-                lifespan=60,
-                max_lifespan=60,
-                font_size=14,
-                dy=-2.0
-            )
+        self._add_floating_text(
+            text="NEW CAPTAIN!",
+            x=x,
+            y=y - 35,
+            color=(255, 255, 100),  # Bright yellow
+            lifespan=60,
+            max_lifespan=60,
+            font_size=14,
+            dy=-2.0
         )
         
         # 🎥 Trigger screen shake for impact
@@ -1689,11 +2112,13 @@ class GameEngine:
         if self.victory_sequence_active:
             self._update_victory_sequence(original_dt)
         
-        # Update captain change timers
-        for country in list(self.captain_change_timer.keys()):
-            self.captain_change_timer[country] -= 1
-            if self.captain_change_timer[country] <= 0:
-                del self.captain_change_timer[country]
+        # Update captain change timers (casi siempre vacío: sin copia de claves en ese caso)
+        if self.captain_change_timer:
+            timers = self.captain_change_timer
+            for country in list(timers):
+                timers[country] -= 1
+                if timers[country] <= 0:
+                    del timers[country]
 
         self.physics_world.update(dt)
         self.update_particles(dt)
@@ -1759,10 +2184,12 @@ class GameEngine:
         
         # Update trail particles for all flags
         if self.game_state == 'RACING':
-            for country, racer in self.physics_world.get_racers().items():
-                x = float(racer.body.position.x) if math.isfinite(racer.body.position.x) else self.physics_world.start_x
-                y = float(racer.body.position.y) if math.isfinite(racer.body.position.y) else (racer.lane * self.physics_world.lane_height + self.physics_world.lane_height // 2)
-                self.particle_manager.update_trail(country, (x, y), racer.color, dt)
+            # Posiciones ya saneadas por physics_world.update; una sola llamada para todas las banderas
+            self.particle_manager.update_trails(
+                [(country, tuple(racer.body.position), racer.color)
+                 for country, racer in self.physics_world.get_racers().items()],
+                dt
+            )
         
         # Update idle animation timer
         if self.game_state == 'IDLE':
@@ -1877,11 +2304,6 @@ class GameEngine:
                 self._frame_count = 0
                 self._last_fps_check_time = current_time
         
-        from .config import GAME_MARGIN
-        
-        # Draw outer background (window margin)
-        self.screen.blit(self.outer_background, (0, 0))
-        
         # 🌌 Render parallax background FIRST (behind everything)
         if self.background_manager:
             try:
@@ -1912,16 +2334,13 @@ class GameEngine:
             self._render_stress_test_banner()
         
         # Render shortcuts panel in COMMENT mode (solo durante RACING)
-        from .config import GAME_MODE
-        import time as time_module
-        
         if GAME_MODE == "COMMENT" and self.game_state == 'RACING':
             # Always show ticker at bottom
             self._render_shortcuts_panel()
             
             # Show fade-out HUD overlay for first 3 seconds
             if self.race_start_time:
-                elapsed = time_module.time() - self.race_start_time
+                elapsed = time.time() - self.race_start_time
                 if elapsed < self.hud_fade_duration:
                     # Calculate fade alpha (1.0 -> 0.0 over 3 seconds)
                     fade_progress = elapsed / self.hud_fade_duration
@@ -1945,11 +2364,18 @@ class GameEngine:
         shake_offset = self.screen_shaker.current_offset
         blit_x = GAME_MARGIN + int(shake_offset[0])
         blit_y = GAME_MARGIN + int(shake_offset[1])
+        shaken = blit_x != GAME_MARGIN or blit_y != GAME_MARGIN
+        zoom_active = self.victory_sequence_active and self.victory_zoom_level > 1.01
+        
+        # 🖼️ Dirty rects: el margen exterior es estático. Solo se repinta (y se hace flip
+        # completo) cuando shake/zoom pueden haberlo ensuciado; si no, basta con
+        # actualizar el rect del área de juego.
+        full_update = self._outer_background_dirty or zoom_active or shaken
         
         # 🎬 Apply subtle camera zoom during victory sequence
         # Note: Instead of cropping (which can cut off content), we scale the whole
         # surface slightly and center it, creating a subtle "push in" effect
-        if self.victory_sequence_active and self.victory_zoom_level > 1.01:
+        if zoom_active:
             zoom = min(self.victory_zoom_level, 1.15)  # Cap at 15% zoom to avoid cutting too much
             
             # Scale up the surface
@@ -1966,11 +2392,39 @@ class GameEngine:
             offset_y = (scaled_height - SCREEN_HEIGHT) // 2
             
             # Blit with offset to center
-            self.screen.blit(scaled_surface, (blit_x - offset_x, blit_y - offset_y))
+            game_rect = self.screen.blit(scaled_surface, (blit_x - offset_x, blit_y - offset_y))
         else:
-            self.screen.blit(self.render_surface, (blit_x, blit_y))
+            game_rect = self.screen.blit(
+                self.render_surface,
+                (blit_x, blit_y) if shaken else self._game_margin_pos
+            )
         
-        pygame.display.flip()
+        if full_update:
+            # Draw outer background (window margin) solo alrededor del área de juego
+            self._blit_outer_margins(game_rect)
+            # Si este frame se desplaza/escala, el siguiente debe limpiar el margen
+            self._outer_background_dirty = shaken or zoom_active
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._game_area_rect)
+    
+    def _blit_outer_margins(self, game_rect: pygame.Rect) -> None:
+        """
+        Paint the outer background only where the game surface did not land.
+        The inner part would be covered by the (animated) render surface anyway,
+        so the four margin strips are copied instead of the whole window.
+        """
+        screen_width, screen_height = self.screen.get_size()
+        strips = (
+            pygame.Rect(0, 0, screen_width, game_rect.top),
+            pygame.Rect(0, game_rect.bottom, screen_width, screen_height - game_rect.bottom),
+            pygame.Rect(0, game_rect.top, game_rect.left, game_rect.height),
+            pygame.Rect(game_rect.right, game_rect.top, screen_width - game_rect.right, game_rect.height),
+        )
+        self.screen.blits(
+            [(self.outer_background, strip.topleft, strip) for strip in strips if strip.width > 0 and strip.height > 0],
+            doreturn=False
+        )
     
     def _render_balls(self) -> None:
         """Render all flag racers with winner spotlight and leader glow."""
@@ -1992,13 +2446,15 @@ class GameEngine:
         if current_leader and current_leader in self.physics_world.racers and not winner:
             self._render_leader_spotlight(self.physics_world.racers[current_leader])
         
-        # Render non-winners first (back layer)
-        for country, racer in self.physics_world.get_racers().items():
+        # Render non-winners first (back layer), desde el snapshot SoA del último update
+        pw = self.physics_world
+        racers = pw.racers
+        for country, x, y, angle in zip(pw.racer_order, pw.positions_x, pw.positions_y, pw.angles):
             # Skip winner for now (render last = on top)
             if country == winner:
                 continue
             
-            self._render_racer(racer, is_winner=False)
+            self._render_racer(racers[country], is_winner=False, pose=(x, y, angle))
         
         # Render winner LAST (appears on top)
         if winner and winner in self.physics_world.racers:
@@ -2068,16 +2524,27 @@ class GameEngine:
                 (ix + int(offset_x) - sparkle_size, iy + int(offset_y) - sparkle_size)
             )
     
-    def _render_racer(self, racer, is_winner: bool = False) -> None:
-        """Render a single racer flag with ON FIRE jitter effect."""
-        x, y = racer.body.position
-        radius = racer.shape.radius
-        angle = racer.body.angle
+    def _render_racer(
+        self,
+        racer,
+        is_winner: bool = False,
+        pose: Optional[tuple[float, float, float]] = None
+    ) -> None:
+        """
+        Render a single racer flag with ON FIRE jitter effect.
         
-        # Sanitize position values
-        x = float(x) if math.isfinite(x) else self.physics_world.start_x
-        y = float(y) if math.isfinite(y) else (racer.lane * self.physics_world.lane_height + self.physics_world.lane_height // 2)
-        radius = float(radius) if math.isfinite(radius) else 30
+        Args:
+            racer: Racer to draw
+            is_winner: Scale up and draw as the winner
+            pose: (x, y, angle) from the PhysicsWorld snapshot; read from the body if omitted
+        """
+        # PhysicsWorld.update garantiza posiciones finitas (ver _sanitize_positions)
+        if pose is None:
+            x, y = racer.body.position
+            angle = racer.body.angle
+        else:
+            x, y, angle = pose
+        radius = racer.shape.radius
         
         # 🔥 ON FIRE jitter effect
         if racer.country in self.on_fire_countries:
@@ -2094,65 +2561,70 @@ class GameEngine:
         if racer.sprite:
             # Scale sprite if winner
             if is_winner:
-                w = self._safe_int(radius * 2, 1)
+                w = int(radius * 2)
                 scaled_sprite = pygame.transform.scale(racer.sprite, (w, w))
-                self._render_sprite(scaled_sprite, x, y, angle, radius)
+                self._render_sprite(scaled_sprite, x, y, angle, radius, cache_rotation=False)
             else:
                 self._render_sprite(racer.sprite, x, y, angle, radius)
         else:
             # Fallback: colored circle
-            ix = self._safe_int(x, self.physics_world.start_x)
-            iy = self._safe_int(y, SCREEN_HEIGHT // 2)
-            ir = self._safe_int(radius, 30)
+            ix = int(x)
+            iy = int(y)
+            ir = int(radius)
             pygame.draw.circle(self.render_surface, racer.color, (ix, iy), ir)
             pygame.draw.circle(self.render_surface, (0, 0, 0), (ix, iy), ir, 2)
         
         # Draw number on LEFT and abbreviation on RIGHT of the flag
-        ix = self._safe_int(x, self.physics_world.start_x)
-        iy = self._safe_int(y, SCREEN_HEIGHT // 2)
+        ix = int(x)
+        iy = int(y)
         
-        # Get country number (1-12 based on lane position)
-        country_number = racer.lane + 1  # Lanes are 0-indexed
-        
-        # Get country abbreviation
-        country_abbrev = self._get_country_abbrev(racer.country)
-        
-        # Font for labels
-        label_font = pygame.font.SysFont("Arial", 11, bold=True)
+        number_surface, abbrev_surface = self._get_racer_label_surfaces(racer)
         
         # === NUMBER on LEFT side ===
         number_x = ix - radius - 18  # To the left of flag edge
-        number_y = iy
-        
-        # Number with yellow color for visibility
-        number_surface = self._render_text_enhanced(
-            str(country_number),
-            label_font,
-            (255, 255, 100),  # Yellow for numbers
-            outline_color=(0, 0, 0),
-            outline_width=1
-        )
-        number_rect = number_surface.get_rect(center=(number_x, number_y))
+        number_rect = number_surface.get_rect(center=(number_x, iy))
         self.render_surface.blit(number_surface, number_rect)
         
         # === ABBREVIATION on RIGHT side ===
         abbrev_x = ix + radius + 20  # To the right of flag edge
-        abbrev_y = iy
-        
-        # Abbreviation with country color
-        abbrev_surface = self._render_text_enhanced(
-            country_abbrev,
-            label_font,
-            racer.color,  # Use country's color
-            outline_color=(0, 0, 0),
-            outline_width=1
-        )
-        abbrev_rect = abbrev_surface.get_rect(center=(abbrev_x, abbrev_y))
+        abbrev_rect = abbrev_surface.get_rect(center=(abbrev_x, iy))
         self.render_surface.blit(abbrev_surface, abbrev_rect)
 
         # 👑 CAPTAIN LABEL
         self._render_captain_label(racer, ix, iy)
 
+    def _get_racer_label_surfaces(self, racer) -> tuple[pygame.Surface, pygame.Surface]:
+        """
+        Get the (number, abbreviation) label surfaces of a racer.
+        Both are static for the whole session: init_pygame pre-renders them for every
+        racer, and they are rebuilt lazily after clear_text_cache.
+        """
+        labels = self._racer_label_surfaces.get(racer.country)
+        if labels is None:
+            label_font = self._font(11)
+            
+            # Number (1-12 based on lane position) with yellow color for visibility
+            number_surface = self._render_text_enhanced(
+                str(racer.lane + 1),  # Lanes are 0-indexed
+                label_font,
+                (255, 255, 100),  # Yellow for numbers
+                outline_color=(0, 0, 0),
+                outline_width=1
+            )
+            
+            # Abbreviation with country color
+            abbrev_surface = self._render_text_enhanced(
+                self._get_country_abbrev(racer.country),
+                label_font,
+                racer.color,  # Use country's color
+                outline_color=(0, 0, 0),
+                outline_width=1
+            )
+            
+            labels = (number_surface, abbrev_surface)
+            self._racer_label_surfaces[racer.country] = labels
+        return labels
+
     def _render_captain_label(self, racer, flag_x: int, flag_y: int) -> None:
         """
         Render captain name below country flag.
@@ -2169,54 +2641,58 @@ class GameEngine:
         label_y = flag_y + 25  # Below flag (reduced from 35 since no country name)
         
         if captain:
-            captain_text = f"@{captain}"
-            
             # Special highlight if just became captain
-            if country in self.captain_change_timer:
-                color = (255, 255, 0)  # Bright yellow for new captain
-                font_size = 15
-            else:
-                # Improved legibility: light gray/off-white for better contrast
-                color = (204, 204, 204)  # #CCCCCC - Light gray for better readability
-                font_size = 12
+            highlighted = country in self.captain_change_timer
             
-            # Render with enhanced text (outline) - 1px outline for better legibility
-            try:
-                captain_font = pygame.font.SysFont("Arial", font_size, bold=True)
-                captain_surface = self._render_text_enhanced(
-                    captain_text,
-                    captain_font,
-                    color,
-                    outline_color=(0, 0, 0),
-                    outline_width=1  # 1px outline as requested
-                )
-                
-                captain_rect = captain_surface.get_rect(center=(flag_x, label_y))
-                self.render_surface.blit(captain_surface, captain_rect)
+            # Caché por país: sólo se re-renderiza si cambia el capitán o el resaltado
+            cached = self._captain_label_cache.get(country)
+            if cached is not None and cached[0] == (captain, highlighted):
+                captain_surface = cached[1]
+            else:
+                if highlighted:
+                    color = (255, 255, 0)  # Bright yellow for new captain
+                    font_size = 15
+                else:
+                    # Improved legibility: light gray/off-white for better contrast
+                    color = (204, 204, 204)  # #CCCCCC - Light gray for better readability
+                    font_size = 12
                 
-            except Exception as e:
-                logger.debug(f"Error rendering captain label: {e}")
-        else:
-            # No captain yet - optional "No Captain" text
-            if self.game_state == 'RACING':  # Only show during active race
+                # Render with enhanced text (outline) - 1px outline for better legibility
                 try:
-                    no_captain_font = pygame.font.SysFont("Arial", 9, bold=True)
-                    # Improved legibility: brighter color and better position
-                    no_captain_surface = self._render_text_enhanced(
-                        "No Captain",
-                        no_captain_font,
-                        (220, 220, 220),  # Brighter gray for better visibility
+                    captain_surface = self._render_text_enhanced(
+                        f"@{captain}",
+                        self._font(font_size),
+                        color,
                         outline_color=(0, 0, 0),
-                        outline_width=2  # Thicker outline for better visibility
+                        outline_width=1  # 1px outline as requested
                     )
-                    
-                    # Position to the right of the flag, aligned with captain text position
-                    no_captain_x = flag_x + 30  # To the right of flag
-                    no_captain_rect = no_captain_surface.get_rect(center=(no_captain_x, label_y))
-                    self.render_surface.blit(no_captain_surface, no_captain_rect)
-                    
-                except Exception:
-                    pass  # Skip if font fails
+                except Exception as e:
+                    logger.debug(f"Error rendering captain label: {e}")
+                    return
+                self._captain_label_cache[country] = ((captain, highlighted), captain_surface)
+            
+            captain_rect = captain_surface.get_rect(center=(flag_x, label_y))
+            self.render_surface.blit(captain_surface, captain_rect)
+        else:
+            # No captain yet - optional "No Captain" text
+            if self.game_state == 'RACING':  # Only show during active race
+                if self._no_captain_surface is None:
+                    try:
+                        # Improved legibility: brighter color and better position
+                        self._no_captain_surface = self._render_text_enhanced(
+                            "No Captain",
+                            self._font(9),
+                            (220, 220, 220),  # Brighter gray for better visibility
+                            outline_color=(0, 0, 0),
+                            outline_width=2  # Thicker outline for better visibility
+                        )
+                    except Exception:
+                        return  # Skip if font fails
+                
+                # Position to the right of the flag, aligned with captain text position
+                no_captain_x = flag_x + 30  # To the right of flag
+                no_captain_rect = self._no_captain_surface.get_rect(center=(no_captain_x, label_y))
+                self.render_surface.blit(self._no_captain_surface, no_captain_rect)
 
     def _render_sprite(
         self, 
@@ -2224,7 +2700,8 @@ class GameEngine:
         x: float, 
         y: float, 
         angle: float,
-        radius: float
+        radius: float,
+        cache_rotation: bool = True
     ) -> None:
         """
         Render a rotated sprite at the physics position.
@@ -2234,43 +2711,40 @@ class GameEngine:
             x, y: Center position
             angle: Angle in radians (from Pymunk)
             radius: Ball radius (for scaling if needed)
+            cache_rotation: Reuse rotations quantized to ROTATION_STEP_DEGREES.
+                Pass False for one-off surfaces (e.g. the per-frame scaled winner).
         """
         # Convert angle from radians to degrees for Pygame
         angle_degrees = math.degrees(angle) if math.isfinite(angle) else 0.0
         
         # Rotate the sprite
-        rotated_sprite = pygame.transform.rotate(sprite, -angle_degrees)
+        if cache_rotation:
+            step = self.ROTATION_STEP_DEGREES
+            bucket = round(angle_degrees / step) % (360 // step)
+            key = (sprite, bucket)
+            rotated_sprite = self._rotated_cache.get(key)
+            if rotated_sprite is None:
+                if len(self._rotated_cache) >= self.ROTATION_CACHE_MAX:
+                    # FIFO: los dicts conservan el orden de inserción
+                    del self._rotated_cache[next(iter(self._rotated_cache))]
+                rotated_sprite = pygame.transform.rotate(sprite, -bucket * step)
+                self._rotated_cache[key] = rotated_sprite
+        else:
+            rotated_sprite = pygame.transform.rotate(sprite, -angle_degrees)
         
-        # Get centered rect (safe int conversion)
-        ix = self._safe_int(x, self.physics_world.start_x)
-        iy = self._safe_int(y, SCREEN_HEIGHT // 2)
-        rect = rotated_sprite.get_rect(center=(ix, iy))
+        # Get centered rect (posiciones ya finitas: ver PhysicsWorld._sanitize_positions)
+        rect = rotated_sprite.get_rect(center=(int(x), int(y)))
         
         # Draw
         self.render_surface.blit(rotated_sprite, rect)
 
-    def _draw_star(self, x: float, y: float, size: int, color: tuple[int, int, int]) -> None:
-        """Draw a simple 8-point star (cross + diagonals)."""
-        # Safe int conversions for all coordinates
-        ix = self._safe_int(x, SCREEN_WIDTH // 2)
-        iy = self._safe_int(y, SCREEN_HEIGHT // 2)
-        
-        pygame.draw.line(self.render_surface, color, 
-                         (ix - size, iy), (ix + size, iy), 2)
-        pygame.draw.line(self.render_surface, color, 
-                         (ix, iy - size), (ix, iy + size), 2)
-        pygame.draw.line(self.render_surface, color, 
-                         (self._safe_int(ix - size*0.7), self._safe_int(iy - size*0.7)), 
-                         (self._safe_int(ix + size*0.7), self._safe_int(iy + size*0.7)), 1)
-        pygame.draw.line(self.render_surface, color, 
-                         (self._safe_int(ix - size*0.7), self._safe_int(iy + size*0.7)), 
-                         (self._safe_int(ix + size*0.7), self._safe_int(iy - size*0.7)), 1)
-
     def _render_header(self) -> None:
         """Render header with leader info and drop shadow for visibility."""
-        header_surface = pygame.Surface((SCREEN_WIDTH, self.header_height), pygame.SRCALPHA)
-        header_surface.fill((20, 20, 20, 200))  # Slightly more transparent
-        self.render_surface.blit(header_surface, (0, 0))
+        # Fondo del header: constante, se crea en el primer frame y se reutiliza
+        if self._header_bg is None:
+            self._header_bg = pygame.Surface((SCREEN_WIDTH, self.header_height), pygame.SRCALPHA)
+            self._header_bg.fill((20, 20, 20, 200))  # Slightly more transparent
+        self.render_surface.blit(self._header_bg, (0, 0))
         
         # Leader info (centrado en el header)
         leader_info = self.physics_world.get_leader()
@@ -2280,7 +2754,7 @@ class GameEngine:
         if self.leader_pop_timer > 0:
             # Escala 1.1x durante el pop
             pop_scale = 1.1
-            pop_font = pygame.font.SysFont("Arial", int(FONT_SIZE * pop_scale), bold=True)
+            pop_font = self._font(int(FONT_SIZE * pop_scale))
             count_surface = self._render_text_with_shadow(
                 leader_text, pop_font, (255, 255, 0), shadow_offset=2
             )
@@ -2311,43 +2785,65 @@ class GameEngine:
             return "Conexión fallida"
         return "Desconectado"
     
+    def _add_message(self, message: str, event_type: EventType) -> None:
+        """Render a feed message once and append it to the bounded message list."""
+        color = COLOR_TEXT_GIFT if event_type == EventType.GIFT else COLOR_TEXT_SYSTEM
+        
+        if len(message) > 55:
+            message = message[:52] + "..."
+        
+        text_surface = self.font_small.render(message, True, color)
+        # deque con maxlen: el mensaje más antiguo se descarta en O(1)
+        self.messages.append((text_surface, event_type))
+        self._messages_dirty = True
+    
     def _render_messages(self) -> None:
         """Render messages at bottom with semi-transparent background."""
-        msg_surface = pygame.Surface((SCREEN_WIDTH, self.message_area_height), pygame.SRCALPHA)
+        strip_top = SCREEN_HEIGHT - self.message_area_height
+        
+        # ⚡ Cache: si los mensajes no cambiaron, la franja completa es un solo blit
+        if not self._messages_dirty and self._msg_cache_surf is not None:
+            self.render_surface.blit(self._msg_cache_surf, (0, strip_top))
+            return
+        
+        # La franja anterior vuelve al pool: la nueva la sobrescribe entera con el fill
+        if self._msg_cache_surf is not None:
+            self._release_surface(self._msg_cache_surf)
+        msg_surface = self._acquire_surface(SCREEN_WIDTH, self.message_area_height, clear=False)
         msg_surface.fill((0, 0, 0, 140))  # Más transparente (140 en lugar de 180)
-        self.render_surface.blit(msg_surface, (0, SCREEN_HEIGHT - self.message_area_height))
         
         y = SCREEN_HEIGHT - PADDING
         
-        for message, event_type in reversed(self.messages):
-            color = COLOR_TEXT_GIFT if event_type == EventType.GIFT else COLOR_TEXT_SYSTEM
-            
-            if len(message) > 55:
-                message = message[:52] + "..."
-            
-            text_surface = self.font_small.render(message, True, color)
+        for text_surface, _ in reversed(self.messages):
             y -= LINE_HEIGHT
             
-            if y < SCREEN_HEIGHT - self.message_area_height + PADDING:
+            if y < strip_top + PADDING:
                 break
             
-            self.render_surface.blit(text_surface, (PADDING, y))
+            msg_surface.blit(text_surface, (PADDING, y - strip_top))
+        
+        self._messages_dirty = False
+        self._msg_cache_surf = msg_surface
+        self.render_surface.blit(msg_surface, (0, strip_top))
     
     def _render_lanes(self) -> None:
         """Draw subtle lane separators."""
-        from .config import COLOR_LANE_LINE
-        
-        lane_height = self.physics_world.lane_height
-        game_area_top = self.physics_world.game_area_top
-        
-        # Create surface with alpha for subtle lines
-        lane_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        
-        for i in range(1, self.physics_world.num_lanes):
-            y = game_area_top + (i * lane_height)
-            pygame.draw.line(lane_surf, COLOR_LANE_LINE, (0, y), (SCREEN_WIDTH, y), 1)
+        if self._lanes_surf is None:
+            from .config import COLOR_LANE_LINE
+            
+            lane_height = self.physics_world.lane_height
+            game_area_top = self.physics_world.game_area_top
+            
+            # Create surface with alpha for subtle lines
+            lane_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            
+            for i in range(1, self.physics_world.num_lanes):
+                y = game_area_top + (i * lane_height)
+                pygame.draw.line(lane_surf, COLOR_LANE_LINE, (0, y), (SCREEN_WIDTH, y), 1)
+            
+            self._lanes_surf = lane_surf.convert_alpha()
         
-        self.render_surface.blit(lane_surf, (0, 0))
+        self.render_surface.blit(self._lanes_surf, (0, 0))
     
     def _render_final_stretch_line(self) -> None:
         """Draw a dashed, blurred yellow line at 80% of track marking where final stretch begins."""
@@ -2369,7 +2865,7 @@ class GameEngine:
         
         # Blur effect: draw multiple lines with slight offsets and reduced opacity
         # Create a temporary surface with alpha channel for blur effect
-        blur_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        blur_surf = self._acquire_surface(SCREEN_WIDTH, SCREEN_HEIGHT)
         
         # Draw multiple blurred layers
         blur_offsets = [-2, -1, 0, 1, 2]  # Horizontal blur spread
@@ -2390,18 +2886,41 @@ class GameEngine:
         
         # Blit the blurred dashed line onto the render surface
         self.render_surface.blit(blur_surf, (0, 0))
+        self._release_surface(blur_surf)
     
     def _render_finish_line(self) -> None:
         """Draw the finish line with smaller checkered pattern."""
-        finish_x = self.physics_world.finish_line_x
         square_size = 12  # Reducido de 30 a 12
         
-        for y in range(0, SCREEN_HEIGHT, square_size):
-            for x in range(0, square_size * 2, square_size):
-                color = (255, 255, 255) if (y // square_size + x // square_size) % 2 == 0 else (0, 0, 0)
-                rect = pygame.Rect(finish_x + x - square_size, y, square_size, square_size)
-                pygame.draw.rect(self.render_surface, color, rect)
+        if self._finish_line_surf is None:
+            surf = pygame.Surface((square_size * 2, SCREEN_HEIGHT))
+            for y in range(0, SCREEN_HEIGHT, square_size):
+                for x in range(0, square_size * 2, square_size):
+                    color = (255, 255, 255) if (y // square_size + x // square_size) % 2 == 0 else (0, 0, 0)
+                    pygame.draw.rect(surf, color, (x, y, square_size, square_size))
+            self._finish_line_surf = surf.convert()
+        
+        self.render_surface.blit(self._finish_line_surf, (self.physics_world.finish_line_x - square_size, 0))
 
+    def _get_winner_ring(self, glow_radius: float) -> Optional[pygame.Surface]:
+        """
+        Devuelve el anillo dorado del spotlight para un radio dado.
+        Los radios se cuantizan a píxeles enteros (igual que al dibujar), así que
+        tras el primer ciclo del pulso todos los anillos salen del cache.
+        """
+        glow_size = self._safe_int(glow_radius * 2, 60)
+        if glow_size <= 0:
+            return None
+        ring_radius = self._safe_int(glow_radius, 30)
+        key = (glow_size, ring_radius)
+        ring = self._winner_ring_cache.get(key)
+        if ring is None:
+            ring = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
+            pygame.draw.circle(ring, (255, 215, 0), (glow_size // 2, glow_size // 2), ring_radius, 4)
+            ring = ring.convert_alpha()
+            self._winner_ring_cache[key] = ring
+        return ring
+    
     def _render_winner_spotlight(self, winner_racer) -> None:
         """Render special effects around the winner (rings, rays, stars)."""
         # Sanitize base position
@@ -2418,60 +2937,83 @@ class GameEngine:
             if not math.isfinite(glow_radius) or glow_radius <= 0:
                 continue
             glow_alpha = max(0, self.winner_glow_alpha - i * 45)
-            glow_size = self._safe_int(glow_radius * 2, 60)
-            if glow_size <= 0:
+            glow_surf = self._get_winner_ring(glow_radius)
+            if glow_surf is None:
                 continue
-            glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, (255, 215, 0, glow_alpha), (glow_size//2, glow_size//2), self._safe_int(glow_radius, 30), 4)
-            self.render_surface.blit(glow_surf, (self._safe_int(x - glow_radius), self._safe_int(y - glow_radius)))
+            # El anillo cacheado es opaco; el pulso de alpha se aplica como alpha de superficie
+            glow_surf.set_alpha(glow_alpha)
+            self.render_surface.blit(glow_surf, (int(x - glow_radius), int(y - glow_radius)))
 
-        # Radial light rays
-        num_rays = 8
+        # A partir de aquí x, y, radius son finitos: int() directo en vez de _safe_int
+        time_ = self.winner_animation_time
+        
+        # Radial light rays (todos en una sola capa reutilizada, recortada al área de los rayos)
         ray_length = 80
-        for i in range(num_rays):
-            angle = (self.winner_animation_time * 2.0 + i * (2 * math.pi / num_rays))
-            start_x = x + math.cos(angle) * radius
-            start_y = y + math.sin(angle) * radius
-            end_x = x + math.cos(angle) * (radius + ray_length)
-            end_y = y + math.sin(angle) * (radius + ray_length)
-            ray_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            alpha = max(0, self.winner_glow_alpha - 80)
+        half = int(radius + ray_length) + 4
+        ray_surf = self._winner_ray_surf
+        if ray_surf is None or ray_surf.get_width() < half * 2:
+            ray_surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+            self._winner_ray_surf = ray_surf
+        ray_surf.fill((0, 0, 0, 0))
+        center = ray_surf.get_width() // 2
+        origin_x = int(x) - center
+        origin_y = int(y) - center
+        ray_color = (255, 223, 0, max(0, self.winner_glow_alpha - 80))
+        outer = radius + ray_length
+        # cos/sin(base + k) = rotación de las direcciones precalculadas: 2 trig por frame
+        base = time_ * 2.0
+        cos_b, sin_b = math.cos(base), math.sin(base)
+        for dir_cos, dir_sin in _SPOTLIGHT_RAY_DIRS:
+            c = cos_b * dir_cos - sin_b * dir_sin
+            s = sin_b * dir_cos + cos_b * dir_sin
             pygame.draw.line(
                 ray_surf, 
-                (255, 223, 0, alpha), 
-                (self._safe_int(start_x), self._safe_int(start_y)), 
-                (self._safe_int(end_x), self._safe_int(end_y)), 
+                ray_color, 
+                (int(x + c * radius) - origin_x, int(y + s * radius) - origin_y), 
+                (int(x + c * outer) - origin_x, int(y + s * outer) - origin_y), 
                 3
             )
-            self.render_surface.blit(ray_surf, (0, 0))
+        self.render_surface.blit(ray_surf, (origin_x, origin_y))
 
         # Orbiting stars
-        num_stars = 10
         star_distance = radius + 48
-        for i in range(num_stars):
-            star_angle = self.winner_animation_time * 1.5 + i * (2 * math.pi / num_stars)
-            star_x = x + math.cos(star_angle) * star_distance
-            star_y = y + math.sin(star_angle) * star_distance
-            twinkle = (math.sin(self.winner_animation_time * 8 + i) + 1) / 2
-            star_size = self._safe_int(2 + twinkle * 5, 3)
+        base = time_ * 1.5
+        cos_b, sin_b = math.cos(base), math.sin(base)
+        # sin(t*8 + i) también por suma de ángulos: 2 trig para las 10 estrellas
+        cos_tw, sin_tw = math.cos(time_ * 8), math.sin(time_ * 8)
+        for (dir_cos, dir_sin), (phase_cos, phase_sin) in zip(_SPOTLIGHT_STAR_DIRS, _SPOTLIGHT_TWINKLE_PHASES):
+            star_x = x + (cos_b * dir_cos - sin_b * dir_sin) * star_distance
+            star_y = y + (sin_b * dir_cos + cos_b * dir_sin) * star_distance
+            twinkle = (sin_tw * phase_cos + cos_tw * phase_sin + 1) / 2
+            star_size = int(2 + twinkle * 5)
             self._draw_star(star_x, star_y, star_size, (255, 255, 200))
 
     def _draw_star(self, x: float, y: float, size: int, color: tuple[int, int, int]) -> None:
-        """Draw a simple 8-point star (cross + diagonals)."""
+        """Draw a simple 8-point star (cross + diagonals) from a cached per-(size, color) template."""
         # Safe int conversions for all coordinates
         ix = self._safe_int(x, SCREEN_WIDTH // 2)
         iy = self._safe_int(y, SCREEN_HEIGHT // 2)
         
-        pygame.draw.line(self.render_surface, color, 
-                         (ix - size, iy), (ix + size, iy), 2)
-        pygame.draw.line(self.render_surface, color, 
-                         (ix, iy - size), (ix, iy + size), 2)
-        pygame.draw.line(self.render_surface, color, 
-                         (self._safe_int(ix - size*0.7), self._safe_int(iy - size*0.7)), 
-                         (self._safe_int(ix + size*0.7), self._safe_int(iy + size*0.7)), 1)
-        pygame.draw.line(self.render_surface, color, 
-                         (self._safe_int(ix - size*0.7), self._safe_int(iy + size*0.7)), 
-                         (self._safe_int(ix + size*0.7), self._safe_int(iy - size*0.7)), 1)
+        # Margen de 2px: las líneas de grosor 2 se salen un píxel del brazo
+        c = size + 2
+        key = (size, color)
+        star = self._star_cache.get(key)
+        if star is None:
+            star = pygame.Surface((c * 2 + 1, c * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.line(star, color, 
+                             (c - size, c), (c + size, c), 2)
+            pygame.draw.line(star, color, 
+                             (c, c - size), (c, c + size), 2)
+            d = size * 0.7
+            pygame.draw.line(star, color, 
+                             (int(c - d), int(c - d)), 
+                             (int(c + d), int(c + d)), 1)
+            pygame.draw.line(star, color, 
+                             (int(c - d), int(c + d)), 
+                             (int(c + d), int(c - d)), 1)
+            star = star.convert_alpha()
+            self._star_cache[key] = star
+        self.render_surface.blit(star, (ix - c, iy - c))
 
     def _render_leaderboard(self) -> None:
         """Render leaderboard overlay when race finished."""
@@ -2484,20 +3026,31 @@ class GameEngine:
             self._render_3d_ranking_visualization()
 
         # Dim background behind the final classification panel
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 140))
-        self.render_surface.blit(overlay, (0, 0))
+        self.render_surface.blit(self._race_finished_overlay, (0, 0))
 
         leaderboard = self.physics_world.get_leaderboard()
         # Limit to first 10 entries only
-        leaderboard = leaderboard[:10]
+        leaderboard = tuple(leaderboard[:10])
+        
+        # La clasificación final no cambia mientras se muestra: el panel se compone una vez
+        if leaderboard != self._leaderboard_cache_key or self._leaderboard_cache_surf is None:
+            self._leaderboard_cache_surf = self._build_leaderboard_surface(leaderboard)
+            self._leaderboard_cache_key = leaderboard
+        surf = self._leaderboard_cache_surf
         
+        # Reduced table width and added side margins
+        side_margin = 20  # Margin on each side of screen
+        table_x = side_margin  # Start with margin from left
+        table_y = SCREEN_HEIGHT - surf.get_height() - 60
+
+        self.render_surface.blit(surf, (table_x, table_y))
+
+    def _build_leaderboard_surface(self, leaderboard: tuple) -> pygame.Surface:
+        """Compose the final classification panel for the given leaderboard rows."""
         # Reduced table width and added side margins
         side_margin = 20  # Margin on each side of screen
         left_margin = 15  # Additional left margin for text visibility
         table_w, table_h = SCREEN_WIDTH - (side_margin * 2), 420  # Full width minus margins
-        table_x = side_margin  # Start with margin from left
-        table_y = SCREEN_HEIGHT - table_h - 60
 
         # Adjusted internal margins for better content fit
         bar_margin_left = 90 + left_margin  # Increased left margin for text visibility
@@ -2510,11 +3063,11 @@ class GameEngine:
         pygame.draw.rect(surf, (5, 5, 10, 255), (0, 0, table_w, table_h), border_radius=10)
         pygame.draw.rect(surf, (255, 215, 0, 180), (0, 0, table_w, table_h), 2, border_radius=10)
         
-        header_font = pygame.font.SysFont("Arial", 18, bold=True)
+        header_font = self._font(18)
         hdr = header_font.render("FINAL CLASSIFICATION", True, (255, 215, 0))
         surf.blit(hdr, (15 + left_margin, 10))  # Add left margin to header
 
-        row_font = pygame.font.SysFont("Arial", 14, bold=True)
+        row_font = self._font(14)
         start_y = 45
         row_h = 35
         max_distance = max(1, self.physics_world.finish_line_x - self.physics_world.start_x)
@@ -2522,6 +3075,8 @@ class GameEngine:
         # Medallas como texto (no emojis)
         medal_text = {1: "[1st]", 2: "[2nd]", 3: "[3rd]"}
         medal_colors = {1: (255, 215, 0), 2: (192, 192, 192), 3: (205, 127, 50)}
+        # Textos de todas las filas: se vuelcan con un único blits() al final
+        text_blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
 
         for idx, (position, country, distance, medal) in enumerate(leaderboard):
             y = start_y + idx * row_h
@@ -2547,30 +3102,32 @@ class GameEngine:
                 pygame.draw.circle(surf, medal_color, (position_x, y + 8), 10)
                 pygame.draw.circle(surf, (255, 255, 255), (position_x, y + 8), 10, 1)
                 pos_s = row_font.render(f"{position}", True, (0, 0, 0))
-                surf.blit(pos_s, (position_x - 4, y))
+                text_blits.append((pos_s, (position_x - 4, y)))
             else:
                 pos_s = row_font.render(f"{position}", True, (200, 200, 200))
-                surf.blit(pos_s, (position_x - 5, y))
+                text_blits.append((pos_s, (position_x - 5, y)))
         
             # Country name (sin medal emoji) - with left margin
             country_x = 45 + left_margin
-            country_s = row_font.render(country, True, (255, 255, 255))
-            # Truncate long country names to fit
-            max_country_width = bar_x - country_x - 10  # Space between country name and bar start
-            if country_s.get_width() > max_country_width:
-                # Truncate country name if too long
-                truncated = country[:12] + "..." if len(country) > 12 else country
-                country_s = row_font.render(truncated, True, (255, 255, 255))
-            surf.blit(country_s, (country_x, y))
+            country_s = self._country_label_cache.get(country)
+            if country_s is None:
+                # Truncate long country names to fit (medido con size(), sin rasterizar dos veces)
+                max_country_width = bar_x - country_x - 10  # Space between country name and bar start
+                label = country
+                if row_font.size(country)[0] > max_country_width and len(country) > 12:
+                    label = country[:12] + "..."
+                country_s = row_font.render(label, True, (255, 255, 255))
+                self._country_label_cache[country] = country_s
+            text_blits.append((country_s, (country_x, y)))
 
             # Distance en diamantes (sin emoji) - positioned with margin
             dist_val = distance if (isinstance(distance, (int, float)) and math.isfinite(distance)) else 0.0
-            diamonds_approx = self._safe_int(dist_val / 0.8, 0)
+            diamonds_approx = self._safe_int(dist_val * _INV_DIAMOND_SIZE, 0)
             dist_txt = f"{diamonds_approx}d"
             dist_s = row_font.render(dist_txt, True, (255, 215, 100))
             # Position with right margin to prevent cutoff
             dist_x = table_w - bar_margin_right - 5  # 5px padding from bar margin
-            surf.blit(dist_s, (dist_x, y))
+            text_blits.append((dist_s, (dist_x, y)))
 
             # Progress bar
             prog = (dist_val / max_distance) if max_distance > 0 else 0.0
@@ -2583,32 +3140,48 @@ class GameEngine:
                 bar_color = medal_colors.get(position, (80, 180, 80))
                 pygame.draw.rect(surf, bar_color, (bar_x, y + 20, filled, bar_h), border_radius=5)
 
-        # Overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.render_surface.blit(overlay, (0, 0))
-
-        self.render_surface.blit(surf, (table_x, table_y))
+        surf.blits(text_blits, doreturn=0)
+        return surf
 
     def _render_legend(self) -> None:
         """Render combat powers table fixed at bottom. Clean, readable, functional."""
-        from .config import SCREEN_WIDTH, SCREEN_HEIGHT, GAME_AREA_BOTTOM
+        from .config import SCREEN_HEIGHT, GAME_AREA_BOTTOM
 
         legend_height = min(58, GAME_AREA_BOTTOM - 4)
         legend_y = SCREEN_HEIGHT - legend_height
         padding = 12
-        row1_y = legend_y + 6
-        row2_y = legend_y + 28
+
+        # Fondo, título y los tres poderes son estáticos: se componen una vez en una surface
+        if self._legend_static is None:
+            self._legend_static = self._build_legend_surface(legend_height, padding)
+        self.render_surface.blit(self._legend_static, (0, legend_y))
+
+        # Frozen indicator
+        if self.physics_world.frozen_countries:
+            parts = [f"{c}: {t:.1f}s" for c, t in self.physics_world.frozen_countries.items()]
+            frozen_font = self._font(10)
+            frozen_surf = self._render_text_enhanced(
+                f"FROZEN: {' | '.join(parts)}",
+                frozen_font,
+                (150, 220, 255),
+                outline_color=(0, 0, 0),
+                outline_width=1,
+            )
+            self.render_surface.blit(frozen_surf, (padding, legend_y + legend_height - 14))
+
+    def _build_legend_surface(self, legend_height: int, padding: int) -> pygame.Surface:
+        """Compose the static part of the combat powers legend (background, title, items)."""
+        row1_y = 6
+        row2_y = 28
 
         # Background: dark bar, clearly visible
         legend_surf = pygame.Surface((SCREEN_WIDTH, legend_height), pygame.SRCALPHA)
         legend_surf.fill((18, 18, 24, 220))
         # Single thin gold separator line (no thick bar)
         pygame.draw.line(legend_surf, (255, 215, 0, 200), (0, 0), (SCREEN_WIDTH, 0), 1)
-        self.render_surface.blit(legend_surf, (0, legend_y))
 
         # Title
-        title_font = pygame.font.SysFont("Arial", 12, bold=True)
+        title_font = self._font(12)
         title_surf = self._render_text_enhanced(
             "COMBAT POWERS",
             title_font,
@@ -2616,7 +3189,8 @@ class GameEngine:
             outline_color=(0, 0, 0),
             outline_width=1,
         )
-        self.render_surface.blit(title_surf, (padding, row1_y - 2))
+        # Título, iconos y textos se vuelcan con un único blits() al final
+        blit_list: list[tuple[pygame.Surface, tuple[int, int]]] = [(title_surf, (padding, row1_y - 2))]
 
         # Three items: [icon] effect / gift name
         items = [
@@ -2625,8 +3199,8 @@ class GameEngine:
             ("hielo", "Freeze 3s", "Helado", (140, 200, 255)),
         ]
         seg = (SCREEN_WIDTH - 2 * padding) // 3
-        eff_font = pygame.font.SysFont("Arial", 11, bold=True)
-        name_font = pygame.font.SysFont("Arial", 9)
+        eff_font = self._font(11)
+        name_font = self._font(9, bold=False)
 
         for i, (icon_type, effect, gift_name, color) in enumerate(items):
             x0 = padding + i * seg
@@ -2637,16 +3211,16 @@ class GameEngine:
             icon = self.asset_manager.get_combat_icon(icon_type)
             if icon:
                 ir = icon.get_rect(center=(icon_x, icon_y))
-                self.render_surface.blit(icon, ir)
+                blit_list.append((icon, ir.topleft))
             else:
                 r = 7
                 if icon_type == "rosa":
-                    pygame.draw.circle(self.render_surface, color, (icon_x, icon_y), r)
+                    pygame.draw.circle(legend_surf, color, (icon_x, icon_y), r)
                 elif icon_type == "pesa":
-                    pygame.draw.rect(self.render_surface, color, (icon_x - r, icon_y - r, 2 * r, 2 * r))
+                    pygame.draw.rect(legend_surf, color, (icon_x - r, icon_y - r, 2 * r, 2 * r))
                 else:
                     pts = [(icon_x, icon_y - r), (icon_x + r, icon_y), (icon_x, icon_y + r), (icon_x - r, icon_y)]
-                    pygame.draw.polygon(self.render_surface, color, pts)
+                    pygame.draw.polygon(legend_surf, color, pts)
 
             eff_surf = self._render_text_enhanced(
                 effect,
@@ -2656,23 +3230,13 @@ class GameEngine:
                 outline_width=1,
             )
             er = eff_surf.get_rect(midleft=(text_x, icon_y - 5))
-            self.render_surface.blit(eff_surf, er)
+            blit_list.append((eff_surf, er.topleft))
             name_surf = name_font.render(gift_name, True, (160, 160, 170))
             nr = name_surf.get_rect(midleft=(text_x, icon_y + 9))
-            self.render_surface.blit(name_surf, nr)
+            blit_list.append((name_surf, nr.topleft))
 
-        # Frozen indicator
-        if self.physics_world.frozen_countries:
-            parts = [f"{c}: {t:.1f}s" for c, t in self.physics_world.frozen_countries.items()]
-            frozen_font = pygame.font.SysFont("Arial", 10, bold=True)
-            frozen_surf = self._render_text_enhanced(
-                f"FROZEN: {' | '.join(parts)}",
-                frozen_font,
-                (150, 220, 255),
-                outline_color=(0, 0, 0),
-                outline_width=1,
-            )
-            self.render_surface.blit(frozen_surf, (padding, legend_y + legend_height - 14))
+        legend_surf.blits(blit_list, doreturn=0)
+        return legend_surf
 
     def assign_country_to_user(self, username: str) -> tuple[str, str]:
         """
@@ -2689,12 +3253,22 @@ class GameEngine:
             return self.user_country_cache[username], "cached"
         
         # Tier 2: Flag emoji detection in username
-        for flag_emoji, country in self.flag_map.items():
-            if flag_emoji in username:
-                self.user_country_cache[username] = country
-                self.country_player_count[country] = self.country_player_count.get(country, 0) + 1
-                logger.info(f"🚩 {username} → {country} (flag detected)")
-                return country, "flag"
+        # Un solo recorrido: solo las parejas de regional indicators se buscan en flag_map
+        if not username.isascii():
+            i = 0
+            last = len(username) - 1
+            while i < last:
+                if _REGIONAL_INDICATOR_MIN <= username[i] <= _REGIONAL_INDICATOR_MAX:
+                    country = self.flag_map.get(username[i:i + 2])
+                    if country is not None:
+                        self.user_country_cache[username] = country
+                        self.country_player_count[country] = self.country_player_count.get(country, 0) + 1
+                        logger.info(f"🚩 {username} → {country} (flag detected)")
+                        return country, "flag"
+                    # Bandera desconocida (o indicador suelto): saltar la pareja completa
+                    i += 2
+                else:
+                    i += 1
         
         # Tier 3: Auto-balance (assign to country with fewest players)
         countries = list(self.physics_world.racers.keys())
@@ -2743,41 +3317,44 @@ class GameEngine:
         self.stress_test_timer += dt
         
         if self.stress_test_timer >= STRESS_TEST_INTERVAL:
-            self.stress_test_timer = 0.0
+            # Todos los intervalos vencidos de una vez (frames largos o intervalos cortos);
+            # el resto del timer se conserva para no perder ritmo
+            due = int(self.stress_test_timer // STRESS_TEST_INTERVAL)
+            self.stress_test_timer -= due * STRESS_TEST_INTERVAL
             
             # Skip if race is finished
             if self.physics_world.race_finished:
                 return
             
-            # Choose random country
-            countries = list(self.physics_world.racers.keys())
-            country = random.choice(countries)
+            # Países y diamantes (1-100) del lote muestreados en una sola llamada cada uno
+            countries = random.choices(self.physics_world.racer_order, k=due)
+            diamond_counts = random.choices(range(1, 101), k=due)
+            racers = self.physics_world.racers
+            apply_gift_impulse = self.physics_world.apply_gift_impulse
             
-            # Random diamond count (1-100)
-            diamond_count = random.randint(1, 100)
-            
-            # Apply gift
-            success = self.physics_world.apply_gift_impulse(
-                country=country,
-                gift_name="Auto Test Gift",
-                diamond_count=diamond_count
-            )
-            
-            if success:
-                # Emit particles
-                racer = self.physics_world.racers[country]
-                pos = (racer.body.position.x, racer.body.position.y)
-                
-                count = 10 + int(diamond_count / 10)
-                power = 0.8
-                
-                self.emit_explosion(
-                    pos=pos,
-                    color=racer.color,
-                    count=count,
-                    power=power,
+            for country, diamond_count in zip(countries, diamond_counts):
+                # Apply gift
+                success = apply_gift_impulse(
+                    country=country,
+                    gift_name="Auto Test Gift",
                     diamond_count=diamond_count
                 )
+                
+                if success:
+                    # Emit particles
+                    racer = racers[country]
+                    pos = (racer.body.position.x, racer.body.position.y)
+                    
+                    count = 10 + diamond_count // 10
+                    power = 0.8
+                    
+                    self.emit_explosion(
+                        pos=pos,
+                        color=racer.color,
+                        count=count,
+                        power=power,
+                        diamond_count=diamond_count
+                    )
 
     def _manual_stress_test_inject(self) -> None:
         """
@@ -2844,14 +3421,13 @@ class GameEngine:
             
             # Get stats
             particle_count = len(self.particles)
-            racer_count = len(self.physics_world.racers)
             
-            # Calculate average distance traveled
-            total_distance = sum(
-                r.body.position.x - self.physics_world.start_x 
-                for r in self.physics_world.racers.values()
+            # Calculate average distance traveled (snapshot SoA de PhysicsWorld)
+            positions_x = self.physics_world.positions_x
+            avg_distance = (
+                sum(positions_x) / len(positions_x) - self.physics_world.start_x
+                if positions_x else 0
             )
-            avg_distance = total_distance / racer_count if racer_count > 0 else 0
             
             # Log performance
             logger.info(
@@ -2866,11 +3442,13 @@ class GameEngine:
     
     def sanitize_username(self, username: str) -> str:
         """Limpia usernames problemáticos que pueden romper el renderizado."""
-        # Eliminar solo caracteres de control; permitir acentos y la mayoría de símbolos
-        sanitized = ''.join(
-            ch for ch in username
-            if ch.isprintable() and ch not in {'\n', '\r', '\t'}
-        )
+        # Eliminar solo caracteres de control; permitir acentos y la mayoría de símbolos.
+        # Fast path: str.isprintable() recorre el string en C (y ya excluye \n, \r, \t),
+        # así que el filtro carácter a carácter solo corre para nombres "sucios".
+        if username.isprintable():
+            sanitized = username
+        else:
+            sanitized = ''.join(ch for ch in username if ch.isprintable())
         
         # Limitar longitud
         if len(sanitized) > 20:
@@ -2882,18 +3460,32 @@ class GameEngine:
         
         return sanitized
     
+    def _font(self, size: int, bold: bool = True, name: str = "Arial") -> pygame.font.Font:
+        """Get a cached SysFont (SysFont scans/opens font files: create each one once)."""
+        key = (name, size, bold)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = pygame.font.SysFont(name, size, bold=bold)
+            self._font_cache[key] = font
+        return font
+    
     def _get_emoji_font(self, size: int) -> pygame.font.Font:
-        """Get a font that supports emoji rendering."""
+        """Get a font that supports emoji rendering (cached per size)."""
+        font = self._emoji_font_cache.get(size)
+        if font is not None:
+            return font
         try:
             # macOS
-            return pygame.font.SysFont("Apple Color Emoji", size)
+            font = pygame.font.SysFont("Apple Color Emoji", size)
         except:
             try:
                 # Windows
-                return pygame.font.SysFont("Segoe UI Emoji", size)
+                font = pygame.font.SysFont("Segoe UI Emoji", size)
             except:
                 # Fallback
-                return pygame.font.SysFont("Arial", size)
+                font = pygame.font.SysFont("Arial", size)
+        self._emoji_font_cache[size] = font
+        return font
 
     def _render_text_with_emoji(
         self, 
@@ -2906,35 +3498,52 @@ class GameEngine:
         Render text that may contain emojis.
         Splits text into emoji and non-emoji parts for proper rendering.
         """
-        import re
-        
-        # Simple approach: use emoji font for everything if text contains emoji
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F1E0-\U0001F1FF"  # flags
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F680-\U0001F6FF"  # transport & map
-            "\U0001F700-\U0001F77F"  # alchemical
-            "\U0001F780-\U0001F7FF"  # geometric
-            "\U0001F800-\U0001F8FF"  # supplemental arrows
-            "\U0001F900-\U0001F9FF"  # supplemental symbols
-            "\U0001FA00-\U0001FA6F"  # chess symbols
-            "\U0001FA70-\U0001FAFF"  # symbols extended
-            "\U00002702-\U000027B0"  # dingbats
-            "\U0001F004-\U0001F0CF"  # playing cards
-            "]+"
-        )
-        
-        has_emoji = emoji_pattern.search(text) is not None
+        # Simple approach: use emoji font for everything if text contains emoji.
+        # Todos los rangos de emoji están fuera de ASCII → str.isascii() (C) evita el regex.
+        has_emoji = not text.isascii() and _EMOJI_RE.search(text) is not None
         
         if has_emoji:
             font = self._get_emoji_font(size)
         else:
-            font = pygame.font.SysFont("Arial", size, bold=bold)
+            font = self._font(size, bold=bold)
         
         return font.render(text, True, color)
     
+    def _add_floating_text(
+        self,
+        text: str,
+        x: float,
+        y: float,
+        color: tuple[int, int, int],
+        dy: float = -2.0,
+        lifespan: int = 60,
+        max_lifespan: int = 60,
+        font_size: int = 16
+    ) -> None:
+        """
+        Show a floating text, recycling a retired FloatingText when one is available.
+        When the ring is full the oldest text is evicted and goes back to the pool.
+        """
+        floating_texts = self.floating_texts
+        pool = self._floating_text_pool
+        if len(floating_texts) == floating_texts.maxlen:
+            pool.append(floating_texts.popleft())
+        
+        if pool:
+            floating_text = pool.pop()
+            floating_text.text = text
+            floating_text.x = x
+            floating_text.y = y
+            floating_text.color = color
+            floating_text.dy = dy
+            floating_text.lifespan = lifespan
+            floating_text.max_lifespan = max_lifespan
+            floating_text.font_size = font_size
+        else:
+            floating_text = FloatingText(text, x, y, color, dy, lifespan, max_lifespan, font_size)
+        
+        floating_texts.append(floating_text)
+    
     def spawn_floating_text(
         self, 
         text: str, 
@@ -2943,23 +3552,14 @@ class GameEngine:
         color: tuple[int, int, int]
     ) -> None:
         """Spawn a floating text effect at the given position."""
-        from .config import FLOATING_TEXT_SPEED, FLOATING_TEXT_LIFESPAN, FLOATING_TEXT_FONT_SIZE
-    
-        floating_text = FloatingText(
-            text=text,
-            x=x,
-            y=y,
-            color=color,
-            dy=-FLOATING_TEXT_SPEED,
-            lifespan=FLOATING_TEXT_LIFESPAN,
-            max_lifespan=FLOATING_TEXT_LIFESPAN,
-            font_size=FLOATING_TEXT_FONT_SIZE
+        # Argumentos posicionales: text, x, y, color, dy, lifespan, max_lifespan, font_size
+        self._add_floating_text(
+            text, x, y, color,
+            -FLOATING_TEXT_SPEED,
+            FLOATING_TEXT_LIFESPAN,
+            FLOATING_TEXT_LIFESPAN,
+            FLOATING_TEXT_FONT_SIZE
         )
-        self.floating_texts.append(floating_text)
-        
-        # Keep floating texts under the configured limit
-        if len(self.floating_texts) > self.MAX_FLOATING_TEXTS:
-            self.floating_texts = self.floating_texts[-self.MAX_FLOATING_TEXTS:]
 
     def _render_victory_flash(self) -> None:
         """
@@ -2973,12 +3573,13 @@ class GameEngine:
             return
         
         # Create white surface with alpha
-        flash_surface = pygame.Surface((ACTUAL_WIDTH, ACTUAL_HEIGHT), pygame.SRCALPHA)
+        flash_surface = self._acquire_surface(ACTUAL_WIDTH, ACTUAL_HEIGHT, clear=False)
         alpha = int(self.victory_flash_alpha)
         flash_surface.fill((255, 255, 255, alpha))
         
         # Blit flash overlay on top of everything
         self.render_surface.blit(flash_surface, (0, 0))
+        self._release_surface(flash_surface)
     
     def _render_text_enhanced(
         self,
@@ -2990,6 +3591,7 @@ class GameEngine:
     ) -> pygame.Surface:
         """
         Render text with enhanced quality: anti-aliasing and thick outline.
+        Composites are cached: callers that change surface alpha must set it before every blit.
         
         Args:
             text: Text to render
@@ -3001,35 +3603,21 @@ class GameEngine:
         Returns:
             Surface with rendered text
         """
-        # Render outline (multiple passes for thickness)
-        outline_surfaces = []
-        for dx in range(-outline_width, outline_width + 1):
-            for dy in range(-outline_width, outline_width + 1):
-                if dx != 0 or dy != 0:
-                    outline_surf = font.render(text, True, outline_color)
-                    outline_surfaces.append((outline_surf, dx, dy))
-        
-        # Render main text with anti-aliasing (True)
-        main_text = font.render(text, True, color)
-        
-        # Create composite surface
-        if outline_surfaces:
-            # Calculate size including outline
-            width = main_text.get_width() + outline_width * 2
-            height = main_text.get_height() + outline_width * 2
-            
-            composite = pygame.Surface((width, height), pygame.SRCALPHA)
-            
-            # Draw all outline layers
-            for outline_surf, dx, dy in outline_surfaces:
-                composite.blit(outline_surf, (outline_width + dx, outline_width + dy))
-            
-            # Draw main text on top
-            composite.blit(main_text, (outline_width, outline_width))
-            
-            return composite
-        else:
-            return main_text
+        return _compose_outlined_text(text, font, color, outline_color, outline_width)
+    
+    def clear_text_cache(self) -> None:
+        """Drop every cached outlined-text composite (and the scaled copies derived from them)."""
+        _compose_outlined_text.cache_clear()
+        _compose_floating_text.cache_clear()
+        _floating_text_surface.cache_clear()
+        self._breathe_cache.clear()
+        self._racer_label_surfaces.clear()
+        self._captain_label_cache.clear()
+        self._no_captain_surface = None
+        self._legend_static = None
+        self._leaderboard_cache_surf = None
+        self._country_label_cache.clear()
+        _compose_shadowed_text.cache_clear()
     
     def _render_text_with_shadow(
         self,
@@ -3043,6 +3631,7 @@ class GameEngine:
         """
         Render text with a soft drop shadow for modern look.
         More performant than full outline for general UI.
+        Composites are cached: callers that change surface alpha must set it before every blit.
         
         Args:
             text: Text to render
@@ -3055,35 +3644,53 @@ class GameEngine:
         Returns:
             Surface with text and drop shadow
         """
-        main_text = font.render(text, True, color)
-        shadow_text = font.render(text, True, shadow_color)
-        
-        # Create surface with room for shadow
-        width = main_text.get_width() + shadow_offset + 2
-        height = main_text.get_height() + shadow_offset + 2
-        
-        composite = pygame.Surface((width, height), pygame.SRCALPHA)
+        return _compose_shadowed_text(text, font, color, shadow_offset, shadow_color, shadow_alpha)
+    
+    def _get_idle_box_surface(self, box_width: int, box_height: int) -> pygame.Surface:
+        """Build the idle message box (gradient + golden border) once and reuse it."""
+        box_surface = self._idle_box_surface
+        if box_surface is not None and box_surface.get_size() == (box_width, box_height):
+            return box_surface
         
-        # Draw shadow with alpha
-        shadow_surf = pygame.Surface(shadow_text.get_size(), pygame.SRCALPHA)
-        shadow_surf.blit(shadow_text, (0, 0))
-        shadow_surf.set_alpha(shadow_alpha)
-        composite.blit(shadow_surf, (shadow_offset, shadow_offset))
+        # Gradient background (una columna 1×H escalada en C, sin draw.line por fila)
+        box_surface = _vertical_gradient_surface(box_width, box_height, (20, 20, 60), (40, 50, 80), alpha=230)
         
-        # Draw main text on top
-        composite.blit(main_text, (0, 0))
+        # Border with golden glow
+        pygame.draw.rect(box_surface, (255, 215, 0, 255), (0, 0, box_width, box_height), 3, border_radius=15)
         
-        return composite
+        box_surface = box_surface.convert_alpha()
+        self._idle_box_surface = box_surface
+        return box_surface
+    
+    def _breathe_level(self, breathe_scale: float) -> int:
+        """Quantize a breathing factor (0.95 - 1.05) to 0..BREATHE_LEVELS-1."""
+        level = round((breathe_scale - 0.95) / 0.10 * (self.BREATHE_LEVELS - 1))
+        return min(max(level, 0), self.BREATHE_LEVELS - 1)
+    
+    def _get_breathe_surface(self, surface: pygame.Surface, breathe_scale: float) -> pygame.Surface:
+        """
+        Return `surface` scaled to the breathing factor (0.95 - 1.05).
+        The factor is quantized to BREATHE_LEVELS steps in total, so each text is
+        only resampled once per level instead of once per frame.
+        """
+        level = self._breathe_level(breathe_scale)
+        key = (surface, level)
+        scaled = self._breathe_cache.get(key)
+        if scaled is None:
+            scale = 0.95 + 0.10 * level / (self.BREATHE_LEVELS - 1)
+            width, height = surface.get_size()
+            scaled_width = int(width * scale)
+            scaled_height = int(height * scale)
+            # scale (nearest) en vez de smoothscale: a ±5% sobre texto ya suavizado no se nota
+            scaled = pygame.transform.scale(surface, (scaled_width, scaled_height))
+            # Safety: acotar la LUT si las superficies fuente cambian (p.ej. fuentes nuevas)
+            if len(self._breathe_cache) >= 128:
+                self._breathe_cache.clear()
+            self._breathe_cache[key] = scaled
+        return scaled
     
     def _render_idle_screen(self) -> None:
         """Render the IDLE state screen with animated prompt."""
-        from .config import SCREEN_WIDTH, SCREEN_HEIGHT, GAME_MODE, COUNTRY_ABBREV
-        
-        # 1️⃣ OVERLAY OSCURO (alpha=150 como solicitado)
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))  # ← Cambiado de 180 a 150
-        self.render_surface.blit(overlay, (0, 0))
-        
         # Central message box - MÁS GRANDE en COMMENT mode para incluir lista
         if GAME_MODE == "COMMENT":
             box_width = 320
@@ -3095,30 +3702,71 @@ class GameEngine:
         box_x = (SCREEN_WIDTH - box_width) // 2
         box_y = (SCREEN_HEIGHT - box_height) // 2
         
-        # Box with gradient effect
-        box_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+        # 2️⃣ TEXTO PULSANTE CON EFECTO "RESPIRACIÓN"
+        # Usar pygame.time.get_ticks() y math.sin para escala sutil (1.0 - 1.05)
+        ticks = pygame.time.get_ticks()
+        breathe_scale = 1.0 + 0.05 * _lut_sin(ticks * 0.003)  # Oscila entre 0.95 y 1.05
+        pulse_alpha = int(200 + 55 * _lut_sin(ticks * 0.0025))
+        
+        # ⚡ Todo lo estático del panel (caja, lista de países, ganador) se compone una vez
+        # y solo se rehace si cambia el ganador
+        idle_key = (
+            GAME_MODE,
+            box_width,
+            box_height,
+            self.last_winner,
+            self.last_winner_distance,
+        )
+        if idle_key != self._idle_frame_key or self._idle_frame_cache is None:
+            self._idle_frame_cache = self._build_idle_panel(box_width, box_height)
+            self._idle_frame_key = idle_key
+        
+        # 1️⃣ OVERLAY OSCURO (alpha=150 como solicitado) - pre-creado en init_pygame
+        blit_list = [
+            (self._idle_overlay, (0, 0)),
+            (self._idle_frame_cache, (box_x, box_y)),
+        ]
         
-        # Gradient background
-        for i in range(box_height):
-            ratio = i / box_height
-            r = int(20 + (40 - 20) * ratio)
-            g = int(20 + (50 - 20) * ratio)
-            b = int(60 + (80 - 60) * ratio)
-            pygame.draw.line(box_surface, (r, g, b, 230), (0, i), (box_width, i))
+        # Textos que respiran: escala de la LUT cuantizada + alpha pulsante como alpha
+        # de superficie al blitear (sin copy ni BLEND_RGBA_MULT por frame)
+        center_x = box_x + box_width // 2
+        for base_surface, center_y in self._idle_breathe_texts:
+            breathe_surface = self._get_breathe_surface(base_surface, breathe_scale)
+            breathe_surface.set_alpha(pulse_alpha)
+            blit_list.append((breathe_surface, breathe_surface.get_rect(center=(center_x, box_y + center_y))))
         
-        # Border with golden glow
-        pygame.draw.rect(box_surface, (255, 215, 0, 255), (0, 0, box_width, box_height), 3, border_radius=15)
+        self.render_surface.blits(blit_list, doreturn=False)
         
-        self.render_surface.blit(box_surface, (box_x, box_y))
+        # 🏆 Render Global Ranking Panel (futuristic style) only
+        # 3D tracks visualization is reserved for post-race screens
+        self._render_global_ranking_futuristic()
+    
+    def _build_idle_panel(self, box_width: int, box_height: int) -> pygame.Surface:
+        """
+        Compose the static part of the idle message box (box, country list, last winner).
+        The breathing texts are left out and stored in _idle_breathe_texts, to be
+        scaled and blitted every frame. Coordinates are relative to the box's top-left corner.
+        """
+        # Box with gradient effect (estático → se construye una sola vez)
+        panel = self._get_idle_box_surface(box_width, box_height).copy()
+        center_x = box_width // 2
+        breathe_texts: list[tuple[pygame.Surface, int]] = []
+        
+        # Todos los blits del panel se acumulan y se envían en una sola llamada blits()
+        blit_list = []
+        
+        # Fuentes del IDLE: se crean una sola vez (SysFont escanea/abre archivos de fuente)
+        if self._idle_fonts is None:
+            self._idle_fonts = {
+                "title": pygame.font.SysFont("Arial", 22, bold=True),
+                "subtitle": pygame.font.SysFont("Arial", 14, bold=True),
+                "item": pygame.font.SysFont("Arial", 12, bold=True),
+                "gift_subtitle": pygame.font.SysFont("Arial", 20, bold=True),
+                "winner": pygame.font.SysFont("Arial", 14, bold=True),
+            }
         
-        # 2️⃣ TEXTO PULSANTE CON EFECTO "RESPIRACIÓN"
-        # Usar pygame.time.get_ticks() y math.sin para escala sutil (1.0 - 1.05)
-        ticks = pygame.time.get_ticks()
-        breathe_scale = 1.0 + 0.05 * math.sin(ticks * 0.003)  # Oscila entre 1.0 y 1.05
-        pulse_alpha = int(200 + 55 * math.sin(ticks * 0.0025))  # Alpha pulsante
-
         # Main title - different text depending on mode
-        title_font = pygame.font.SysFont("Arial", 22, bold=True)
+        title_font = self._idle_fonts["title"]
         if GAME_MODE == "COMMENT":
             title_text = "VOTE IN CHAT!"
         else:
@@ -3132,32 +3780,21 @@ class GameEngine:
             outline_width=3
         )
         
-        # Aplicar escala de "respiración" a la superficie
-        scaled_width = int(title_surface.get_width() * breathe_scale)
-        scaled_height = int(title_surface.get_height() * breathe_scale)
-        title_surface = pygame.transform.smoothscale(title_surface, (scaled_width, scaled_height))
-        
-        # Apply pulsating alpha
-        title_alpha_surface = pygame.Surface(title_surface.get_size(), pygame.SRCALPHA)
-        title_alpha_surface.fill((255, 255, 255, pulse_alpha))
-        title_surface = title_surface.copy()
-        title_surface.blit(title_alpha_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-        
-        title_rect = title_surface.get_rect(center=(box_x + box_width // 2, box_y + 40))
-        self.render_surface.blit(title_surface, title_rect)
+        # Respira cada frame → se escala y blitea en _render_idle_screen
+        breathe_texts.append((title_surface, 40))
 
         # COMMENT MODE: Mostrar lista de opciones dentro del recuadro
         if GAME_MODE == "COMMENT":
             # Subtitle
-            subtitle_font = pygame.font.SysFont("Arial", 14, bold=True)
+            subtitle_font = self._idle_fonts["subtitle"]
             subtitle_text = "Type # or SIGLA to start:"
             subtitle_surface = subtitle_font.render(subtitle_text, True, (200, 200, 200))
-            subtitle_rect = subtitle_surface.get_rect(center=(box_x + box_width // 2, box_y + 70))
-            self.render_surface.blit(subtitle_surface, subtitle_rect)
+            subtitle_rect = subtitle_surface.get_rect(center=(center_x, 70))
+            blit_list.append((subtitle_surface, subtitle_rect))
             
             # Lista de países (2 columnas para compactar)
-            item_font = pygame.font.SysFont("Arial", 12, bold=True)
-            y_offset = box_y + 95
+            item_font = self._idle_fonts["item"]
+            y_offset = 95
             line_height = 24
             col_width = box_width // 2
             
@@ -3169,25 +3806,25 @@ class GameEngine:
                 col = 0 if i <= 6 else 1
                 row = (i - 1) % 6
                 
-                x_base = box_x + 20 + (col * col_width)
+                x_base = 20 + (col * col_width)
                 y_pos = y_offset + (row * line_height)
                 
                 # Number
                 number_text = f"{i:2d}"
                 number_surface = item_font.render(number_text, True, (255, 255, 100))
-                self.render_surface.blit(number_surface, (x_base, y_pos))
+                blit_list.append((number_surface, (x_base, y_pos)))
                 
                 # Separator
                 sep_surface = item_font.render("→", True, (150, 150, 150))
-                self.render_surface.blit(sep_surface, (x_base + 25, y_pos))
+                blit_list.append((sep_surface, (x_base + 25, y_pos)))
                 
                 # Sigla (with country color)
                 sigla_surface = item_font.render(abbrev, True, color)
-                self.render_surface.blit(sigla_surface, (x_base + 45, y_pos))
+                blit_list.append((sigla_surface, (x_base + 45, y_pos)))
         
         else:
             # GIFT MODE: Subtitle con mismo efecto de respiración
-            subtitle_font = pygame.font.SysFont("Arial", 20, bold=True)
+            subtitle_font = self._idle_fonts["gift_subtitle"]
             subtitle_text = "TO START!"
             subtitle_surface = self._render_text_enhanced(
                 subtitle_text,
@@ -3197,44 +3834,41 @@ class GameEngine:
                 outline_width=3
             )
             
-            # Aplicar escala de "respiración"
-            scaled_width = int(subtitle_surface.get_width() * breathe_scale)
-            scaled_height = int(subtitle_surface.get_height() * breathe_scale)
-            subtitle_surface = pygame.transform.smoothscale(subtitle_surface, (scaled_width, scaled_height))
-            
-            # Apply pulsating alpha
-            subtitle_alpha_surface = pygame.Surface(subtitle_surface.get_size(), pygame.SRCALPHA)
-            subtitle_alpha_surface.fill((255, 255, 255, pulse_alpha))
-            subtitle_surface = subtitle_surface.copy()
-            subtitle_surface.blit(subtitle_alpha_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-            
-            subtitle_rect = subtitle_surface.get_rect(center=(box_x + box_width // 2, box_y + 95))
-            self.render_surface.blit(subtitle_surface, subtitle_rect)
+            # Mismo efecto de respiración que el título
+            breathe_texts.append((subtitle_surface, 95))
 
         # Last winner info (if exists) - sin efecto de respiración
         if self.last_winner:
-            winner_font = pygame.font.SysFont("Arial", 14, bold=True)
-            winner_text = f"Last winner: {self.last_winner}"
-            winner_surface = self._render_text_enhanced(
-                winner_text,
-                winner_font,
-                (100, 255, 150),
-                outline_color=(0, 0, 0),
-                outline_width=2
-            )
-            winner_rect = winner_surface.get_rect(center=(box_x + box_width // 2, box_y + 140))
-            self.render_surface.blit(winner_surface, winner_rect)
-            
-            # Distance info
-            diamonds_approx = self._safe_int(self.last_winner_distance / 0.8, 0)
-            distance_text = f"Distance: {diamonds_approx} diamonds"
-            distance_surface = winner_font.render(distance_text, True, (200, 200, 200))
-            distance_rect = distance_surface.get_rect(center=(box_x + box_width // 2, box_y + 165))
-            self.render_surface.blit(distance_surface, distance_rect)
-        
-        # 🏆 Render Global Ranking Panel (futuristic style) only
-        # 3D tracks visualization is reserved for post-race screens
-        self._render_global_ranking_futuristic()
+            # Los textos solo cambian en _return_to_idle → cachear ambos surfaces
+            winner_key = (self.last_winner, self.last_winner_distance)
+            if self._cached_winner_key != winner_key:
+                winner_font = self._idle_fonts["winner"]
+                winner_text = f"Last winner: {self.last_winner}"
+                winner_surface = self._render_text_enhanced(
+                    winner_text,
+                    winner_font,
+                    (100, 255, 150),
+                    outline_color=(0, 0, 0),
+                    outline_width=2
+                )
+                
+                # Distance info
+                diamonds_approx = self._safe_int(self.last_winner_distance * _INV_DIAMOND_SIZE, 0)
+                distance_text = f"Distance: {diamonds_approx} diamonds"
+                distance_surface = winner_font.render(distance_text, True, (200, 200, 200))
+                
+                self._cached_winner_key = winner_key
+                self._cached_winner_surfaces = (winner_surface, distance_surface)
+            
+            winner_surface, distance_surface = self._cached_winner_surfaces
+            winner_rect = winner_surface.get_rect(center=(center_x, 140))
+            blit_list.append((winner_surface, winner_rect))
+            distance_rect = distance_surface.get_rect(center=(center_x, 165))
+            blit_list.append((distance_surface, distance_rect))
+        
+        panel.blits(blit_list, doreturn=False)
+        self._idle_breathe_texts = breathe_texts
+        return panel
     
     def _render_shortcuts_panel(self) -> None:
         """
@@ -3254,7 +3888,7 @@ class GameEngine:
         self.render_surface.blit(ticker_bg, (0, ticker_y))
         
         # Build ticker content string with colors
-        item_font = pygame.font.SysFont("Arial", 12, bold=True)
+        item_font = self._font(12)
         separator = "  •  "
         
         # Calculate total width of one complete cycle
@@ -3291,18 +3925,11 @@ class GameEngine:
         
         for _ in range(2):  # Draw twice for seamless scrolling
             for num_surf, arrow_surf, sigla_surf, sep_surf in item_surfaces:
-                # Render each component
-                self.render_surface.blit(num_surf, (x_pos, y_center - num_surf.get_height() // 2))
-                x_pos += num_surf.get_width() + 3
-                
-                self.render_surface.blit(arrow_surf, (x_pos, y_center - arrow_surf.get_height() // 2))
-                x_pos += arrow_surf.get_width() + 3
-                
-                self.render_surface.blit(sigla_surf, (x_pos, y_center - sigla_surf.get_height() // 2))
-                x_pos += sigla_surf.get_width() + 3
-                
-                self.render_surface.blit(sep_surf, (x_pos, y_center - sep_surf.get_height() // 2))
-                x_pos += sep_surf.get_width() + 6
+                # Render each component (un solo get_size() por surface)
+                for surf, gap in ((num_surf, 3), (arrow_surf, 3), (sigla_surf, 3), (sep_surf, 6)):
+                    surf_w, surf_h = surf.get_size()
+                    self.render_surface.blit(surf, (x_pos, y_center - surf_h // 2))
+                    x_pos += surf_w + gap
         
         # Optional: Add subtle gold borders at top and bottom
         pygame.draw.line(self.render_surface, (255, 215, 0, 100), (0, ticker_y), (SCREEN_WIDTH, ticker_y), 1)
@@ -3329,8 +3956,8 @@ class GameEngine:
         overlay.fill((0, 0, 0, bg_alpha))
         
         # "GO!" text with glow effect
-        title_font = pygame.font.SysFont("Arial", 48, bold=True)
-        subtitle_font = pygame.font.SysFont("Arial", 16, bold=True)
+        title_font = self._font(48)
+        subtitle_font = self._font(16)
         
         # Main title
         title_color = (255, 215, 0)  # Gold
@@ -3400,7 +4027,7 @@ class GameEngine:
         self.render_surface.blit(panel_surface, (panel_x, panel_y))
         
         # Title: "*** RÉCORDS MUNDIALES ***"
-        title_font = pygame.font.SysFont("Arial", 16, bold=True)
+        title_font = self._font(16)
         title_text = "*** WORLD RECORDS ***"
         title_surface = self._render_text_enhanced(
             title_text,
@@ -3413,8 +4040,8 @@ class GameEngine:
         self.render_surface.blit(title_surface, title_rect)
         
         # Render Top 3 countries
-        entry_font = pygame.font.SysFont("Arial", 14, bold=True)
-        medal_font = pygame.font.SysFont("Arial", 16, bold=True)
+        entry_font = self._font(14)
+        medal_font = self._font(16)
         
         start_y = panel_y + 50
         line_height = 32
@@ -3450,7 +4077,7 @@ class GameEngine:
         
         # Footer: last update time (optional)
         if self.global_rank_last_update > 0:
-            footer_font = pygame.font.SysFont("Arial", 9)
+            footer_font = self._font(9, bold=False)
             elapsed = time.time() - self.global_rank_last_update
             if elapsed < 60:
                 footer_text = "Updated a few seconds ago"
@@ -3546,16 +4173,8 @@ class GameEngine:
         self.render_surface.blit(panel_surface, (panel_x, panel_y))
         
         # Title with glow effect - using improved font
-        font_names = ["Verdana", "Arial Black", "Arial"]
-        title_font = None
-        for font_name in font_names:
-            try:
-                title_font = pygame.font.SysFont(font_name, 20, bold=True)
-                break
-            except:
-                continue
-        if title_font is None:
-            title_font = pygame.font.Font(None, 20)
+        # (SysFont no lanza con nombres desconocidos: cae a la fuente por defecto)
+        title_font = self._font(20, name="Verdana")
         
         title_text = "* WORLD RECORDS *"
         
@@ -3572,23 +4191,8 @@ class GameEngine:
         self.render_surface.blit(title_surface, title_rect)
         
         # Render Top 3 with enhanced styling - using improved fonts
-        font_names = ["Verdana", "Arial Black", "Arial"]
-        entry_font = None
-        medal_font = None
-        for font_name in font_names:
-            try:
-                if entry_font is None:
-                    entry_font = pygame.font.SysFont(font_name, 16, bold=True)
-                if medal_font is None:
-                    medal_font = pygame.font.SysFont(font_name, 18, bold=True)
-                if entry_font and medal_font:
-                    break
-            except:
-                continue
-        if entry_font is None:
-            entry_font = pygame.font.Font(None, 16)
-        if medal_font is None:
-            medal_font = pygame.font.Font(None, 18)
+        entry_font = self._font(16, name="Verdana")
+        medal_font = self._font(18, name="Verdana")
         
         start_y = panel_y + 65
         line_height = 35
@@ -3628,16 +4232,7 @@ class GameEngine:
         
         # Footer with update time - using improved font
         if self.global_rank_last_update > 0:
-            font_names = ["Verdana", "Arial Black", "Arial"]
-            footer_font = None
-            for font_name in font_names:
-                try:
-                    footer_font = pygame.font.SysFont(font_name, 10)
-                    break
-                except:
-                    continue
-            if footer_font is None:
-                footer_font = pygame.font.Font(None, 10)
+            footer_font = self._font(10, bold=False, name="Verdana")
             elapsed = time.time() - self.global_rank_last_update
             if elapsed < 60:
                 footer_text = "Updated a few seconds ago"
@@ -3702,18 +4297,21 @@ class GameEngine:
             track_color = neon_colors[i % len(neon_colors)]
             
             # Draw track with glow effect
-            # Outer glow
+            # Outer glow (capa del tamaño de la pista, no de pantalla completa; grosor máx. 8 + 6)
+            glow_origin_x = track_start_x - 4
+            glow_origin_y = track_y - 16
             for glow_radius in range(3, 0, -1):
                 alpha = 50 // (glow_radius + 1)
-                glow_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+                glow_surf = self._acquire_surface(track_length + 8, 32)
                 pygame.draw.line(
                     glow_surf,
                     (*track_color, alpha),
-                    (track_x_start, track_y),
-                    (track_x_end, track_y),
+                    (track_x_start - glow_origin_x, 16),
+                    (track_x_end - glow_origin_x, 16),
                     int(track_width) + glow_radius * 2
                 )
-                self.render_surface.blit(glow_surf, (0, 0))
+                self.render_surface.blit(glow_surf, (glow_origin_x, glow_origin_y))
+                self._release_surface(glow_surf)
             
             # Main track line
             pygame.draw.line(
@@ -3766,7 +4364,7 @@ class GameEngine:
             
             # Country abbreviation on flag
             abbrev = self._get_country_abbrev(country)
-            flag_font = pygame.font.SysFont("Arial", int(flag_radius * 0.8), bold=True)
+            flag_font = self._font(int(flag_radius * 0.8))
             abbrev_surf = flag_font.render(abbrev, True, (255, 255, 255))
             abbrev_rect = abbrev_surf.get_rect(center=(int(flag_x), int(flag_y)))
             self.render_surface.blit(abbrev_surf, abbrev_rect)
@@ -3806,20 +4404,24 @@ class GameEngine:
         arch_glow = 0.7 + 0.3 * math.sin(self.ranking_3d_animation_time * 1.5)
         arch_color = (100, 200, 255)  # Cyan
         
-        # Draw semi-circular arch (top half)
+        # Draw semi-circular arch (top half), en una capa que solo cubre el arco más grande
+        arch_half = arch_radius + 4 * 3 + 4
+        arch_origin_x = arch_center_x - arch_half
+        arch_origin_y = arch_center_y - arch_half
         for i in range(5):
             alpha = int(200 * arch_glow / (i + 1))
             glow_radius = arch_radius + i * 3
-            arch_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            arch_surf = self._acquire_surface(arch_half * 2, arch_half * 2)
             pygame.draw.arc(
                 arch_surf,
                 (*arch_color, alpha),
-                (arch_center_x - glow_radius, arch_center_y - glow_radius, glow_radius * 2, glow_radius * 2),
+                (arch_half - glow_radius, arch_half - glow_radius, glow_radius * 2, glow_radius * 2),
                 0,
                 math.pi,
                 arch_width + i * 2
             )
-            self.render_surface.blit(arch_surf, (0, 0))
+            self.render_surface.blit(arch_surf, (arch_origin_x, arch_origin_y))
+            self._release_surface(arch_surf)
     
     def _get_country_abbrev(self, country: str) -> str:
         """
@@ -3863,6 +4465,10 @@ class GameEngine:
     
         # Limpiar partículas también para un reset limpio
         self.particles.clear()
+        
+        # Soltar textos de la carrera anterior (y fuentes creadas al vuelo)
+        self.clear_text_cache()
+        self._cached_winner_key = None
     
         # Clear user assignments
         self.user_country_cache.clear()
@@ -3871,7 +4477,7 @@ class GameEngine:
         # Clear keyword binding assignments
         self.user_assignments.clear()
         self.users_notified.clear()
-        self.last_join_time.clear()
+        self.last_join_time_ns.clear()
         
         # Change to IDLE state
         self.game_state = 'IDLE'
@@ -3879,6 +4485,7 @@ class GameEngine:
 
         # 👑 Clear captain system
         self.session_points.clear()
+        self._country_best.clear()
         self.current_captains.clear()
         self.captain_change_timer.clear()
         
@@ -3934,8 +4541,9 @@ class GameEngine:
         self.country_player_count.clear()
         self.user_assignments.clear()
         self.users_notified.clear()
-        self.last_join_time.clear()
+        self.last_join_time_ns.clear()
         self.session_points.clear()
+        self._country_best.clear()
         self.current_captains.clear()
         self.captain_change_timer.clear()
         self.race_synced = False
@@ -4075,17 +4683,15 @@ class GameEngine:
         else:
             base_font_size = 16
         
-        self.floating_texts.append(
-            FloatingText(
-                text=combo_text,
-                x=x,
-                y=y - 40,
-                color=color,
-                lifespan=50,
-                max_lifespan=50,
-                font_size=base_font_size,
-                dy=-3.0  # Fast upward
-            )
+        self._add_floating_text(
+            text=combo_text,
+            x=x,
+            y=y - 40,
+            color=color,
+            lifespan=50,
+            max_lifespan=50,
+            font_size=base_font_size,
+            dy=-3.0  # Fast upward
         )
         
         # ✨ Add flash effect on milestone combos (5, 10, 15, 20...)
@@ -4121,22 +4727,20 @@ class GameEngine:
         y = racer.body.position.y
         
         # Big announcement
-        self.floating_texts.append(
-            FloatingText(
-                text="🔥 ON FIRE! 🔥",
-                x=x,
-                y=y - 50,
-                color=(255, 100, 0),
-                lifespan=80,
-                max_lifespan=80,
-                font_size=20,
-                dy=-2.0
-            )
+        self._add_floating_text(
+            text="🔥 ON FIRE! 🔥",
+            x=x,
+            y=y - 50,
+            color=(255, 100, 0),
+            lifespan=80,
+            max_lifespan=80,
+            font_size=20,
+            dy=-2.0
         )
         
         # Initialize motion trail history
         if country not in self.motion_trail_history:
-            self.motion_trail_history[country] = []
+            self.motion_trail_history[country] = deque(maxlen=self.MOTION_TRAIL_MAX_HISTORY)
         if country not in self.motion_trails:
             self.motion_trails[country] = []
         
@@ -4161,35 +4765,39 @@ class GameEngine:
         Args:
             dt: Delta time in seconds
         """
+        # Locales: evitar cadenas de atributos por racer y por frame
+        racers = self.physics_world.racers
+        trail_history = self.motion_trail_history
+        on_fire = self.on_fire_countries
+        fire_max_history = self.MOTION_TRAIL_MAX_HISTORY
+        
         # Update position history for all racers
-        for country, racer in self.physics_world.racers.items():
-            x = float(racer.body.position.x)
-            y = float(racer.body.position.y)
-            
-            if country not in self.motion_trail_history:
-                self.motion_trail_history[country] = []
+        for country, racer in racers.items():
+            history = trail_history.get(country)
+            if history is None:
+                history = trail_history[country] = deque(maxlen=fire_max_history)
             
             # Add current position to history
-            history = self.motion_trail_history[country]
+            x, y = racer.body.position
             history.append((x, y))
             
-            # Limit history length based on ON FIRE status
-            max_history = 15 if country in self.on_fire_countries else 8
-            while len(history) > max_history:
-                history.pop(0)
+            # Limit history length based on ON FIRE status (maxlen ya acota el caso ON FIRE)
+            if country not in on_fire:
+                while len(history) > 8:
+                    history.popleft()
         
         # Build trail segments from history for ON FIRE countries
-        for country in self.on_fire_countries:
-            if country not in self.motion_trail_history:
+        for country in on_fire:
+            if country not in trail_history:
                 continue
-            if country not in self.physics_world.racers:
+            if country not in racers:
                 continue
             
-            history = self.motion_trail_history[country]
+            history = trail_history[country]
             if len(history) < 2:
                 continue
             
-            racer = self.physics_world.racers[country]
+            racer = racers[country]
             base_color = racer.color
             
             # Clear old segments and rebuild
@@ -4223,12 +4831,15 @@ class GameEngine:
     
     def _update_combo_flashes(self, dt: float) -> None:
         """Update combo flash effects."""
-        alive_flashes = []
-        for flash in self.combo_flashes:
+        # Compactación in-place (dos índices): sin lista nueva por frame
+        flashes = self.combo_flashes
+        write = 0
+        for flash in flashes:
             flash.time += dt
             if flash.time < flash.duration:
-                alive_flashes.append(flash)
-        self.combo_flashes = alive_flashes
+                flashes[write] = flash
+                write += 1
+        del flashes[write:]
     
     def _render_motion_trails(self) -> None:
         """
@@ -4471,7 +5082,7 @@ class GameEngine:
         overlay.fill((0, 0, 0, bg_alpha))
         
         # Main text with glow
-        font = pygame.font.SysFont("Arial", 36, bold=True)
+        font = self._font(36)
         
         # Glow effect (multiple layers)
         glow_color = (255, int(100 + 100 * pulse), 0)  # Orange pulsing
@@ -4499,7 +5110,7 @@ class GameEngine:
         
         overlay = pygame.Surface((SCREEN_WIDTH, 36), pygame.SRCALPHA)
         overlay.fill((180, 0, 0, 200))
-        font = pygame.font.SysFont("Arial", 20, bold=True)
+        font = self._font(20)
         text = font.render("STRESS TEST ACTIVE", True, (255, 255, 255))
         r = text.get_rect(center=(SCREEN_WIDTH // 2, 18))
         overlay.blit(text, r)
@@ -4618,8 +5229,10 @@ class GameEngine:
         """Update confetti particles physics."""
         from .config import SCREEN_HEIGHT
         
-        alive = []
-        for p in self.confetti_particles:
+        # Compactación in-place (dos índices): sin lista nueva por frame
+        confetti = self.confetti_particles
+        write = 0
+        for p in confetti:
             # Update position
             p.x += p.vx * dt
             p.y += p.vy * dt
@@ -4639,9 +5252,10 @@ class GameEngine:
             
             # Keep if still alive and on screen
             if p.lifetime > 0 and p.y < SCREEN_HEIGHT + 50:
-                alive.append(p)
+                confetti[write] = p
+                write += 1
         
-        self.confetti_particles = alive
+        del confetti[write:]
     
     def _render_victory_sequence(self) -> None:
         """Render the epic victory sequence overlay."""
@@ -4723,8 +5337,8 @@ class GameEngine:
         banner.fill((0, 0, 0, bg_alpha))
         
         # Winner text with golden glow
-        title_font = pygame.font.SysFont("Arial", 42, bold=True)
-        subtitle_font = pygame.font.SysFont("Arial", 20, bold=True)
+        title_font = self._font(42)
+        subtitle_font = self._font(20)
         
         # Pulsing gold color
         pulse = 0.5 + 0.5 * math.sin(self.victory_sequence_time * 6.0)
@@ -4736,7 +5350,7 @@ class GameEngine:
         # Apply scale from entrance animation
         scaled_size = int(42 * self.victory_banner_scale)
         if scaled_size > 8:
-            title_font = pygame.font.SysFont("Arial", scaled_size, bold=True)
+            title_font = self._font(scaled_size)
         
         title_surf = self._render_text_enhanced(
             winner_text,
@@ -4785,7 +5399,7 @@ class GameEngine:
         alpha = int(255 * fade_in)
         
         # CTA text
-        cta_font = pygame.font.SysFont("Arial", 16, bold=True)
+        cta_font = self._font(16)
         cta_text = "🎁 Send a GIFT to claim YOUR crown next race! 🎁"
         
         cta_surf = self._render_text_with_shadow(
@@ -4934,8 +5548,7 @@ class GameEngine:
             logger.info(f"🎁 {username} auto-joined {country} via gift {gift_name}")
             
             # Visual feedback
-            racer = self.physics_world.racers[country]
-            lane_y = self.physics_world.game_area_top + (racer.lane * self.physics_world.lane_height) + (self.physics_world.lane_height // 2)
+            lane_y = self._lane_y[country]
             
             self.spawn_floating_text(
                 f"@{username} joined!",
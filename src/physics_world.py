@@ -98,6 +98,13 @@ class PhysicsWorld:
         self._create_boundaries()
         self._create_racers()
         
+        # SoA snapshot: posiciones y ángulos en el mismo orden que self.racers
+        self.racer_order: list[str] = []
+        self.positions_x: list[float] = []
+        self.positions_y: list[float] = []
+        self.angles: list[float] = []
+        self._sync_positions()
+        
         logger.info("🏁 Physics world initialized - FLAG RACE MODE")
         logger.info(f"📍 Start: {self.start_x}px | Finish: {self.finish_line_x}px | Flag radius: {FLAG_RADIUS}px")
     
@@ -296,6 +303,62 @@ class PhysicsWorld:
         winner_country, _ = max(crossed, key=lambda t: t[1])
         self._declare_winner(winner_country)
     
+    def _sync_positions(self) -> None:
+        """Refresh the pose snapshot used by leader/average queries and racer rendering."""
+        self.racer_order = list(self.racers)
+        bodies = [r.body for r in self.racers.values()]
+        positions = [body.position for body in bodies]
+        self.positions_x = [p.x for p in positions]
+        self.positions_y = [p.y for p in positions]
+        self.angles = [body.angle for body in bodies]
+    
+    def _sanitize_positions(self) -> None:
+        """
+        Guarantee finite racer positions after a physics step (one check per racer).
+        A NaN/inf body poisons the shared static body and every groove joint, so the
+        whole simulation state is repaired, not just the offending racer.
+        """
+        isfinite = math.isfinite
+        for racer in self.racers.values():
+            x, y = racer.body.position
+            if not (isfinite(x) and isfinite(y)):
+                self._repair_physics_state()
+                return
+    
+    def _repair_physics_state(self) -> None:
+        """Reset non-finite bodies to their lane start and rebuild poisoned groove joints."""
+        isfinite = math.isfinite
+        
+        # El static body comparte impulsos con todos los joints: un NaN se propaga a todos los carriles
+        static_body = self.space.static_body
+        static_body.velocity = (0.0, 0.0)
+        static_body.angular_velocity = 0.0
+        
+        for racer in self.racers.values():
+            body = racer.body
+            # El ángulo primero: con un ángulo NaN, asignar la posición vuelve a dar NaN
+            body.angle = 0.0
+            body.angular_velocity = 0.0
+            body.velocity = (0.0, 0.0)
+            body.force = (0.0, 0.0)
+            body.torque = 0.0
+            
+            x, y = body.position
+            if not (isfinite(x) and isfinite(y)):
+                lane_y = self.game_area_top + (racer.lane * self.lane_height) + (self.lane_height // 2)
+                logger.warning(f"⚠️ Non-finite position for {racer.country}, resetting to lane start")
+                body.position = (self.start_x, lane_y)
+            if not isfinite(racer.target_x):
+                racer.target_x = self.start_x
+        
+        # El impulso acumulado (warm start) de los joints quedó en NaN: reemplazarlos por nuevos
+        for joint in list(self.space.constraints):
+            if isinstance(joint, pymunk.GrooveJoint) and not isfinite(joint.impulse):
+                self.space.remove(joint)
+                self.space.add(pymunk.GrooveJoint(
+                    joint.a, joint.b, joint.groove_a, joint.groove_b, joint.anchor_b
+                ))
+    
     def update(self, dt: float) -> None:
         """Update the physics simulation with smooth Lerp movement."""
     
@@ -333,9 +396,14 @@ class PhysicsWorld:
         for _ in range(PHYSICS_STEPS):
             self.space.step(step_dt)
     
+        # Posiciones finitas garantizadas aquí (una vez por frame) → el render no necesita comprobarlas
+        self._sanitize_positions()
+        
         # Check for winner based on VISUAL position (body.position.x)
         if not self.race_finished:
             self._check_for_winner()
+        
+        self._sync_positions()
     
         # Auto-reset after winner declared
         if self.race_finished:
@@ -355,8 +423,10 @@ class PhysicsWorld:
         if not self.racers:
             return None
         
-        leader = max(self.racers.items(), key=lambda x: x[1].body.position.x)
-        return leader[0], leader[1].body.position.x
+        # Usa el snapshot SoA (actualizado en cada update) en vez de recorrer los bodies
+        xs = self.positions_x
+        idx = max(range(len(xs)), key=xs.__getitem__)
+        return self.racer_order[idx], xs[idx]
     
     def get_leader_country(self) -> Optional[str]:
         """
@@ -514,6 +584,7 @@ class PhysicsWorld:
         self.race_finished = False
         self.win_time = 0.0
         self.final_leaderboard = None
+        self._sync_positions()
         
         # Clear trail particles when race resets
         if self.game_engine and hasattr(self.game_engine, 'particle_manager'):
@@ -0,0 +1,87 @@
+"""
+Unit tests for GameEngine.assign_country_to_user flag detection.
+
+The method only touches plain dicts, so it is exercised on a lightweight
+stand-in for the engine instead of a full GameEngine (no pygame display needed).
+"""
+
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+# Add project root to path (game_engine uses package-relative imports)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def make_engine(player_counts=None):
+    """Build the minimal state assign_country_to_user reads and writes."""
+    return SimpleNamespace(
+        user_country_cache={},
+        country_player_count=dict(player_counts or {}),
+        flag_map={
+            "🇦🇷": "Argentina",
+            "🇲🇽": "Mexico",
+            "🇺🇸": "USA",
+            "🇷🇺": "Russia",
+        },
+        # Argentina already has a player, so auto-balance always picks Mexico
+        physics_world=SimpleNamespace(racers={"Argentina": None, "Mexico": None}),
+    )
+
+
+class TestAssignCountryFlagDetection(unittest.TestCase):
+    """Tests for the regional-indicator scan in assign_country_to_user."""
+
+    def setUp(self):
+        from src.game_engine import GameEngine
+        self.assign = GameEngine.assign_country_to_user
+        self.engine = make_engine({"Argentina": 1})
+
+    def test_ascii_name_is_auto_balanced(self):
+        """A plain ASCII username never matches a flag."""
+        country, assignment = self.assign(self.engine, "player123")
+
+        self.assertEqual((country, assignment), ("Mexico", "balanced"))
+        self.assertEqual(self.engine.user_country_cache["player123"], "Mexico")
+
+    def test_known_flag(self):
+        """A known flag anywhere in the name assigns its country."""
+        country, assignment = self.assign(self.engine, "fan🇦🇷")
+
+        self.assertEqual((country, assignment), ("Argentina", "flag"))
+        self.assertEqual(self.engine.country_player_count["Argentina"], 2)
+
+    def test_first_flag_in_name_wins(self):
+        """With two flags, the one that appears first in the name is used."""
+        country, assignment = self.assign(self.engine, "🇲🇽🇦🇷")
+
+        self.assertEqual((country, assignment), ("Mexico", "flag"))
+
+    def test_pair_straddling_two_flags_does_not_match(self):
+        """🇦🇷🇺🇸 contains the 🇷🇺 code points, but only aligned pairs count."""
+        country, assignment = self.assign(self.engine, "🇦🇷🇺🇸")
+
+        self.assertEqual((country, assignment), ("Argentina", "flag"))
+
+    def test_unknown_pair_then_known_flag(self):
+        """An unknown flag is skipped as a whole pair, then the next flag matches."""
+        country, assignment = self.assign(self.engine, "🇫🇷🇺🇸")
+
+        self.assertEqual((country, assignment), ("USA", "flag"))
+
+    def test_lone_trailing_indicator_is_ignored(self):
+        """A single regional indicator at the end is not a flag."""
+        country, assignment = self.assign(self.engine, "abc🇲")
+
+        self.assertEqual((country, assignment), ("Mexico", "balanced"))
+
+    def test_cached_user_keeps_country(self):
+        """A second call returns the cached assignment."""
+        self.assign(self.engine, "fan🇦🇷")
+
+        self.assertEqual(self.assign(self.engine, "fan🇦🇷"), ("Argentina", "cached"))
+
+
+if __name__ == '__main__':
+    unittest.main()